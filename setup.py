@@ -28,8 +28,10 @@ setup(
     ],
     extras_require={
         "dev": [
-            "pytest>=7.0.0",
+            "pytest>=7.3.0",
+            "pytest-asyncio>=0.24.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.0.0",
             "flake8>=4.0.0",
             "mypy>=0.950",
             "black>=22.0.0",
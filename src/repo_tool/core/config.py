@@ -4,6 +4,7 @@ Configuration management for RepoTool
 from pathlib import Path
 import yaml
 from typing import Dict, Any, Optional
+import copy
 import os
 
 import os
@@ -89,7 +90,7 @@ class Config:
         try:
             with open(self.config_file) as f:
                 config = yaml.safe_load(f)
-            return {**DEFAULT_CONFIG, **config}  # Merge with defaults
+            return {**copy.deepcopy(DEFAULT_CONFIG), **config}  # Merge with defaults
         except Exception as e:
             print(f"Error loading config: {e}")
             return self._create_default_config()
@@ -101,7 +102,7 @@ class Config:
         with open(self.config_file, 'w') as f:
             yaml.dump(DEFAULT_CONFIG, f)
         
-        return DEFAULT_CONFIG.copy()
+        return copy.deepcopy(DEFAULT_CONFIG)
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value"""
@@ -126,7 +127,7 @@ class Config:
 
     def reset(self) -> None:
         """Reset configuration to defaults"""
-        self.config = DEFAULT_CONFIG.copy()
+        self.config = copy.deepcopy(DEFAULT_CONFIG)
         self._save_config()
 
     def get_download_path(self) -> Path:
@@ -3,7 +3,8 @@ Message center for RepoTool
 """
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from functools import cached_property
+from typing import Dict, List, Optional
 from enum import Enum
 import json
 from pathlib import Path
@@ -30,6 +31,16 @@ class Message:
     details: Optional[dict] = None
     progress: Optional[float] = None
     
+    @cached_property
+    def formatted_time(self) -> str:
+        """Timestamp formatted for display"""
+        return self.timestamp.strftime("%Y-%m-%d %H:%M:%S")
+        
+    @cached_property
+    def type_upper(self) -> str:
+        """Upper-cased message type for display"""
+        return self.type.value.upper()
+        
     def to_dict(self) -> dict:
         """Convert message to dictionary"""
         return {
@@ -53,6 +64,15 @@ class Message:
             progress=data["progress"]
         )
 
+# SQL expression for each aggregate() grouping; time buckets are sliced from
+# the ISO timestamp so no per-row formatting happens in Python
+_AGGREGATE_KEYS = {
+    "type": "type",
+    "source": "source",
+    "day": "substr(timestamp, 1, 10)",
+    "hour": "substr(timestamp, 1, 10) || ' ' || substr(timestamp, 12, 2) || ':00'",
+}
+
 class MessageCenter:
     """Central message management system"""
     
@@ -191,6 +211,52 @@ class MessageCenter:
             
         return messages
         
+    def aggregate(
+        self,
+        group_by: str,
+        since: Optional[datetime] = None
+    ) -> Dict[str, int]:
+        """Count messages per group in the database
+        
+        Args:
+            group_by: One of "type", "source", "day" or "hour"
+            since: Only count messages after this timestamp
+            
+        Returns:
+            Dict[str, int]: Message count per group. Type and source counts are
+            ordered most common first, time buckets chronologically.
+        """
+        if group_by not in _AGGREGATE_KEYS:
+            raise ValueError(f"Unsupported grouping: {group_by}")
+            
+        query = f"SELECT {_AGGREGATE_KEYS[group_by]} AS key, COUNT(*) FROM messages"
+        params = []
+        
+        if since:
+            query += " WHERE timestamp > ?"
+            params.append(since.isoformat())
+            
+        query += " GROUP BY key"
+        if group_by in ("day", "hour"):
+            query += " ORDER BY key"
+        else:
+            query += " ORDER BY COUNT(*) DESC, key"
+            
+        with sqlite3.connect(self.db_path) as conn:
+            return dict(conn.execute(query, params).fetchall())
+            
+    def version(self) -> tuple:
+        """Get a cheap marker of the stored messages
+        
+        Returns:
+            tuple: Message count and latest timestamp; changes whenever
+            messages are added or cleared
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute(
+                "SELECT COUNT(*), MAX(timestamp) FROM messages"
+            ).fetchone()
+            
     def clear_messages(
         self,
         older_than: Optional[datetime] = None,
@@ -2,7 +2,7 @@
 Repository management functionality
 """
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple
 from pathlib import Path
 import os
 import git
@@ -22,6 +22,7 @@ class Repository:
     url: str
     description: Optional[str] = None
     default_branch: str = "main"
+    pushed_at: Optional[str] = None
 
 class RepoManager:
     """Manages repository operations across different services"""
@@ -57,7 +58,17 @@ class RepoManager:
 
     def get_all_repositories(self) -> List[Repository]:
         """Get repositories from all configured services"""
+        return self.fetch_repositories()[0]
+
+    def fetch_repositories(self) -> Tuple[List[Repository], Set[str]]:
+        """Get repositories from all configured services
+
+        Returns:
+            Tuple[List[Repository], Set[str]]: The repositories, and the services
+            whose listing was fetched successfully
+        """
         repos = []
+        fetched = set()
         
         for service, client in self.clients.items():
             try:
@@ -69,7 +80,8 @@ class RepoManager:
                             service="github",
                             url=repo.clone_url,
                             description=repo.description,
-                            default_branch=repo.default_branch
+                            default_branch=repo.default_branch,
+                            pushed_at=repo.pushed_at.isoformat() if repo.pushed_at else None
                         )
                         for repo in user_repos
                     ])
@@ -81,7 +93,8 @@ class RepoManager:
                             service="gitlab",
                             url=repo.http_url_to_repo,
                             description=repo.description,
-                            default_branch=repo.default_branch
+                            default_branch=repo.default_branch,
+                            pushed_at=repo.last_activity_at
                         )
                         for repo in user_repos
                     ])
@@ -93,22 +106,28 @@ class RepoManager:
                             service="bitbucket",
                             url=repo["links"]["clone"][0]["href"],
                             description=repo.get("description", ""),
-                            default_branch=repo.get("mainbranch", {}).get("name", "main")
+                            default_branch=repo.get("mainbranch", {}).get("name", "main"),
+                            pushed_at=repo.get("updated_on")
                         )
                         for repo in user_repos
                     ])
+                fetched.add(service)
             except Exception as e:
                 logger.error(f"Failed to fetch repositories from {service}: {e}")
                 
-        return repos
+        return repos, fetched
 
     def download_repository(
         self,
         repo: Repository,
         destination: Path,
         progress_callback=None
-    ) -> None:
-        """Download a repository to the specified location"""
+    ) -> Path:
+        """Download a repository to the specified location
+
+        Returns:
+            Path: Directory the repository was cloned into
+        """
         try:
             # Ensure destination exists
             destination.mkdir(parents=True, exist_ok=True)
@@ -127,6 +146,7 @@ class RepoManager:
                 str(repo_path),
                 progress=progress
             )
+            return repo_path
             
         except Exception as e:
             logger.error(f"Failed to download repository {repo.name}: {e}")
@@ -137,10 +157,12 @@ class RepoManager:
         repos: List[Repository],
         destination: Path,
         progress_callback=None,
-    ) -> None:
+    ) -> List[Path]:
         """Download multiple repositories sequentially."""
-        for repo in repos:
+        return [
             self.download_repository(repo, destination, progress_callback)
+            for repo in repos
+        ]
 
     def validate_destination(self, path: Path) -> bool:
         """Validate if a destination path is suitable for download"""
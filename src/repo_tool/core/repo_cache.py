@@ -0,0 +1,119 @@
+"""
+Persistent cache of repository listings
+"""
+from dataclasses import asdict
+from pathlib import Path
+from typing import Iterable, List, Optional
+import json
+import sqlite3
+from .repo import Repository
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+class RepoCache:
+    """SQLite-backed cache of the last fetched repository list"""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """Initialize repository cache
+
+        Args:
+            db_path: Path to the cache database. If None, uses default location.
+        """
+        if db_path is None:
+            db_path = Path.home() / ".cache" / "repo_tool" / "repos.sqlite"
+
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self._init_db()
+
+    def _init_db(self):
+        """Initialize the cache database"""
+        self._connect().close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the cache database, recreating it if it was deleted
+
+        The cache directory can be emptied while the app runs (e.g. by the
+        diagnostics cleanup), so the schema is ensured on every connection.
+        """
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS repos (
+                service TEXT NOT NULL,
+                name TEXT NOT NULL,
+                pushed_at TEXT,
+                payload TEXT NOT NULL,
+                PRIMARY KEY (service, name)
+            )
+        """)
+        return conn
+
+    def load(self) -> List[Repository]:
+        """Load cached repositories
+
+        Rows written by an incompatible version of Repository are skipped.
+
+        Returns:
+            List[Repository]: Cached repositories in the order they were first stored
+        """
+        try:
+            with self._connect() as conn:
+                rows = conn.execute("SELECT payload FROM repos ORDER BY rowid").fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to read repository cache: {e}")
+            return []
+
+        repos = []
+        for (payload,) in rows:
+            try:
+                repos.append(Repository(**json.loads(payload)))
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable repository cache entry: {e}")
+        return repos
+
+    def update(self, repos: List[Repository], services: Iterable[str] = ()) -> int:
+        """Store a freshly fetched repository list
+
+        Existing rows are only rewritten when the service reports a newer
+        ``pushed_at``. Repositories that are no longer listed are removed,
+        but only for the services given, so a service that could not be
+        reached keeps its cached rows.
+
+        Args:
+            repos: Repositories returned by the services
+            services: Services whose listing in repos is complete
+
+        Returns:
+            int: Number of rows inserted, updated or removed
+        """
+        fresh = {(repo.service, repo.name) for repo in repos}
+        services = set(services)
+
+        with self._connect() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                """
+                INSERT INTO repos (service, name, pushed_at, payload)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (service, name) DO UPDATE
+                SET pushed_at = excluded.pushed_at, payload = excluded.payload
+                WHERE excluded.pushed_at > repos.pushed_at
+                OR (repos.pushed_at IS NULL AND excluded.pushed_at IS NOT NULL)
+                """,
+                [
+                    (repo.service, repo.name, repo.pushed_at, json.dumps(asdict(repo)))
+                    for repo in repos
+                ]
+            )
+            stale = [
+                key for key in conn.execute("SELECT service, name FROM repos")
+                if key[0] in services and key not in fresh
+            ]
+            conn.executemany(
+                "DELETE FROM repos WHERE service = ? AND name = ?",
+                stale
+            )
+            conn.commit()
+            return conn.total_changes - before
@@ -5,6 +5,7 @@ import subprocess
 from pathlib import Path
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass
+from functools import cached_property
 import json
 from github import Github
 import gitlab
@@ -36,6 +37,11 @@ class RepoInfo:
     forks: int
     service: str
 
+    @cached_property
+    def full_name(self) -> str:
+        """Repository name qualified by its owner (owner/name)"""
+        return f"{self.owner}/{self.name}"
+
 class RepositoryOperations:
     """Advanced repository operations manager"""
     
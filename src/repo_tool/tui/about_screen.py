@@ -11,6 +11,7 @@ from textual.widgets import (
     Footer
 )
 from textual.binding import Binding
+from rich.text import Text
 from importlib.metadata import version, metadata
 from pathlib import Path
 import sys
@@ -26,6 +27,9 @@ LOGO = """
 ╚═╝  ╚═╝╚══════╝╚═╝      ╚═════╝    ╚═╝    ╚═════╝  ╚═════╝ ╚══════╝
 """
 
+# Static logo as a ready-made Text, shared by every AboutScreen
+_LOGO_TEXT = Text(LOGO, no_wrap=True)
+
 ABOUT_TEXT = """
 # About RepoTool
 
@@ -73,7 +77,7 @@ class AboutScreen(Screen):
     def compose(self) -> ComposeResult:
         """Create child widgets"""
         yield Container(
-            Label(LOGO, id="logo"),
+            Label(_LOGO_TEXT, id="logo"),
             ScrollableContainer(
                 Markdown(self.get_about_text()),
                 id="about-content"
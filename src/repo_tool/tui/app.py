@@ -16,17 +16,29 @@ from textual.widgets import (
 from textual.screen import Screen
 from textual.reactive import reactive
 from textual.binding import Binding
+from textual.worker import Worker, WorkerState, get_current_worker
 from rich.text import Text
+from dataclasses import dataclass
+from typing import Set
 
 from ..core.auth import TokenManager
 from ..core.repo import RepoManager
+from ..core.repo_cache import RepoCache
+from ..core.repo_ops import RepositoryOperations
 from ..core.config import Config
 from pathlib import Path
+import queue
 import threading
+from concurrent.futures import FIRST_COMPLETED, CancelledError, Future, wait
+from functools import partial
 from ..core.logger import setup_logger
 from .repo_screen import RepoManagementScreen
 from .about_screen import AboutScreen
 from .message_screen import MessageCenterScreen
+from .debounce import Debouncer
+
+# Seconds between progress redraws during a download
+PROGRESS_INTERVAL = 0.1
 
 # ASCII art logo
 LOGO = """
@@ -38,6 +50,66 @@ LOGO = """
 ╚═╝  ╚═╝╚══════╝╚═╝      ╚═════╝    ╚═╝    ╚═════╝  ╚═════╝ ╚══════╝
 """
 
+# Built once so compose() doesn't re-parse the logo for markup each time
+_LOGO_TEXT = Text(LOGO, no_wrap=True)
+
+class DownloadPool:
+    """Run downloads on daemon threads, at most max_workers at a time
+
+    ThreadPoolExecutor joins its workers at interpreter exit, so quitting
+    mid-download would wait for every queued clone. Here a clone still
+    running when the app quits does not keep the process alive.
+    """
+
+    def __init__(self, max_workers: int):
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._lock = threading.Lock()
+        self._pending: Set[Future] = set()
+        self._shutdown = False
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """Schedule fn(*args, **kwargs) and return its future"""
+        future: Future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("Cannot start a download after shutdown")
+            self._pending.add(future)
+        threading.Thread(
+            target=self._run,
+            args=(future, fn, args, kwargs),
+            name="repo-download",
+            daemon=True,
+        ).start()
+        return future
+
+    def _run(self, future: Future, fn, args, kwargs) -> None:
+        """Wait for a free slot, then run fn unless it was cancelled meanwhile"""
+        with self._slots:
+            with self._lock:
+                self._pending.discard(future)
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    def shutdown(self) -> None:
+        """Refuse new downloads and cancel those still waiting for a slot"""
+        with self._lock:
+            self._shutdown = True
+            pending, self._pending = self._pending, set()
+        for future in pending:
+            future.cancel()
+
+@dataclass(frozen=True)
+class DownloadState:
+    """Snapshot of download progress shown on a download screen"""
+    percent: float = 0.0
+    message: str = ""
+
 class RepoToolApp(App):
     """Main RepoTool TUI Application"""
     
@@ -62,14 +134,25 @@ class RepoToolApp(App):
         self.config = Config()
         self.token_manager = TokenManager()
         self.repo_manager = RepoManager()
+        self.repo_cache = RepoCache()
+        self._repo_ops = None
         self.logger = setup_logger()
+        # Shared by all download screens so concurrent clones stay within
+        # the configured limit
+        self.download_pool = DownloadPool(
+            max(1, int(self.config.get_download_options().get("max_concurrent", 3)))
+        )
         self.selected_repos = set()
+        self.repo_map = {}
+        self.repo_list = []
+        self._search_index = []
+        self._search_debounce = Debouncer(self)
 
     def compose(self) -> ComposeResult:
         """Create child widgets"""
         yield Header(show_clock=True)
         yield Container(
-            Label(LOGO, id="logo"),
+            Label(_LOGO_TEXT, id="logo"),
             Vertical(
                 Input(placeholder="Search repositories...", id="search"),
                 ListView(id="repo-list"),
@@ -84,23 +167,79 @@ class RepoToolApp(App):
         self.check_auth()
         self.load_repositories()
 
+    @property
+    def repo_ops(self) -> RepositoryOperations:
+        """Repository operations shared by all screens, created on first use"""
+        if self._repo_ops is None:
+            self._repo_ops = RepositoryOperations()
+        return self._repo_ops
+
+    def reset_repo_ops(self) -> None:
+        """Drop the shared repository operations so new credentials are used"""
+        self._repo_ops = None
+
+    def on_unmount(self) -> None:
+        """Stop accepting downloads and drop queued ones when the app exits"""
+        self.download_pool.shutdown()
+
     def check_auth(self) -> None:
         """Verify authentication tokens"""
         if not self.token_manager.has_valid_tokens():
             self.push_screen(AuthScreen())
 
     def load_repositories(self) -> None:
-        """Load repositories from all configured services"""
+        """Show cached repositories, then refresh them from all configured services"""
+        self.show_repositories(self.repo_cache.load())
+        self.run_worker(self._refresh_repositories, thread=True, exclusive=True)
+
+    def _refresh_repositories(self) -> None:
+        """Fetch repositories in a worker thread and update the cache"""
+        try:
+            repos, fetched = self.repo_manager.fetch_repositories()
+            if self.repo_cache.update(repos, fetched):
+                # Reload so services that failed keep showing their cached rows
+                self.call_from_thread(self.show_repositories, self.repo_cache.load())
+        except Exception as e:
+            self.logger.error(f"Failed to load repositories: {e}")
+            self.call_from_thread(self.notify, f"Error: {str(e)}", severity="error")
+
+    def show_repositories(self, repos) -> None:
+        """Populate the repository list"""
         try:
-            repos = self.repo_manager.get_all_repositories()
             self.repo_map = {repo.name: repo for repo in repos}
-            self.query_one("#repo-list").clear()
-            for repo in repos:
-                self.query_one("#repo-list").append(repo.name)
+            self._search_index = [(repo.name.lower(), repo) for repo in repos]
+            # A background refresh must not drop a filter the user typed
+            query = self.query_one("#search", Input).value
+            if query:
+                self._apply_filter(query)
+            else:
+                self._render_repo_list(repos)
         except Exception as e:
             self.logger.error(f"Failed to load repositories: {e}")
             self.notify(f"Error: {str(e)}", severity="error")
 
+    def _render_repo_list(self, repos) -> None:
+        """Replace the repository list contents in a single mount"""
+        # Kept in display order so list positions map straight to repositories
+        self.repo_list = list(repos)
+        list_view = self.query_one("#repo-list", ListView)
+        with self.batch_update():
+            list_view.clear()
+            list_view.extend([ListItem(Label(repo.name)) for repo in self.repo_list])
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Filter the repository list once typing in the search box pauses"""
+        if event.input.id != "search":
+            return
+        self._search_debounce(partial(self._apply_filter, event.value))
+
+    def _apply_filter(self, query: str) -> None:
+        """Show only repositories whose name contains query"""
+        query = query.lower()
+        self._render_repo_list(
+            [repo for name_lower, repo in self._search_index if query in name_lower]
+        )
+
     def action_refresh(self) -> None:
         """Refresh repository list"""
         self.load_repositories()
@@ -125,13 +264,19 @@ class RepoToolApp(App):
         """Show message center screen"""
         self.push_screen(MessageCenterScreen())
 
+    def _highlighted_repo(self):
+        """Return the repository under the list cursor, if any"""
+        index = self.query_one("#repo-list", ListView).index
+        if index is None or index >= len(self.repo_list):
+            return None
+        return self.repo_list[index]
+
     def action_toggle_select(self) -> None:
         """Toggle selection of highlighted repository"""
-        list_view = self.query_one("#repo-list")
-        item = list_view.highlighted_child
-        if item is None:
+        repo = self._highlighted_repo()
+        if repo is None:
             return
-        name = str(item)
+        name = repo.name
         if name in self.selected_repos:
             self.selected_repos.remove(name)
         else:
@@ -141,25 +286,26 @@ class RepoToolApp(App):
     def action_download(self) -> None:
         """Download selected repositories"""
         if self.selected_repos:
-            repos = [self.repo_map[name] for name in self.selected_repos]
+            # A refresh may have removed repositories selected before it
+            repos = [
+                self.repo_map[name] for name in self.selected_repos
+                if name in self.repo_map
+            ]
             self.selected_repos.clear()
-            self.push_screen(MultiDownloadScreen(repos))
+            if repos:
+                self.push_screen(MultiDownloadScreen(repos))
         else:
-            list_view = self.query_one("#repo-list")
-            item = list_view.highlighted_child
-            if item:
-                repo = self.repo_map.get(str(item))
-                if repo:
-                    self.push_screen(DownloadScreen(repo))
+            repo = self._highlighted_repo()
+            if repo:
+                self.push_screen(DownloadScreen(repo))
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Handle repository selection via Enter key"""
-        list_view = self.query_one("#repo-list")
-        item = list_view.highlighted_child
-        if item:
-            self.current_repo = self.repo_map.get(str(item))
-            if self.current_repo:
-                self.action_download()
+        if event.list_view.id != "repo-list":
+            return
+        self.current_repo = self._highlighted_repo()
+        if self.current_repo:
+            self.action_download()
 
 class AuthScreen(Screen):
     """Authentication Screen"""
@@ -202,7 +348,78 @@ class SettingsScreen(Screen):
             ),
         )
 
-class DownloadScreen(Screen):
+class ProgressScreen(Screen):
+    """Base screen that runs a download thread and renders its progress"""
+
+    state = reactive(DownloadState(), init=False)
+
+    def __init__(self):
+        super().__init__()
+        # Filled by the download thread, drained on the event loop
+        self._progress_q = queue.SimpleQueue()
+
+    def on_mount(self) -> None:
+        self._bar = self.query_one("#download-progress", ProgressBar)
+        self._status = self.query_one("#download-status", Label)
+        self.query_one("#spinner").display = True
+        self._drain_timer = self.set_interval(PROGRESS_INTERVAL, self._drain_progress)
+        dest = Path(self.query_one("#location").value or str(self.app.config.get_download_path()))
+        self.run_worker(
+            partial(self._download, dest),
+            thread=True,
+            exclusive=True,
+            exit_on_error=False,
+        )
+
+    def _download(self, dest: Path):
+        """Download into dest from a worker thread
+
+        Each download screen implements this, reporting progress through
+        _report() and finishing with _complete() on the event loop.
+        """
+        raise NotImplementedError
+
+    def _as_completed(self, futures):
+        """Yield futures as they finish, stopping early if the worker is cancelled"""
+        worker = get_current_worker()
+        pending = set(futures)
+        while pending and not worker.is_cancelled:
+            done, pending = wait(pending, timeout=PROGRESS_INTERVAL, return_when=FIRST_COMPLETED)
+            yield from done
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Report a failed download instead of leaving the spinner running"""
+        if event.state == WorkerState.ERROR:
+            self._complete(f"Download failed: {event.worker.error}")
+
+    def _complete(self, message: str) -> None:
+        """Flush pending progress, stop the spinner and show a final status"""
+        # Stop draining first so no later tick can replace the final status
+        self._drain_timer.stop()
+        self._drain_progress()
+        self.query_one("#spinner").display = False
+        self._status.update(message)
+
+    def watch_state(self, state: DownloadState) -> None:
+        """Redraw the progress bar and status label in a single pass"""
+        with self.app.batch_update():
+            self._bar.update(progress=state.percent)
+            self._status.update(state.message)
+
+    def _report(self, percent: float, message: str) -> None:
+        """Queue progress from the download thread"""
+        self._progress_q.put_nowait(DownloadState(percent, message))
+
+    def _drain_progress(self) -> None:
+        """Show only the most recent queued progress"""
+        state = None
+        while not self._progress_q.empty():
+            state = self._progress_q.get_nowait()
+        if state is not None:
+            self.state = state
+
+
+class DownloadScreen(ProgressScreen):
     """Download Screen"""
 
     def __init__(self, repo):
@@ -218,38 +435,34 @@ class DownloadScreen(Screen):
             Label("", id="download-status"),
         )
 
-    def on_mount(self) -> None:
-        self.query_one("#spinner").display = True
-        dest = self.query_one("#location").value or str(self.app.config.get_download_path())
-        thread = threading.Thread(target=self._download, args=(Path(dest),), daemon=True)
-        thread.start()
-
     def _download(self, dest: Path):
-        self.app.repo_manager.download_repository(
+        future = self.app.download_pool.submit(
+            self.app.repo_manager.download_repository,
             self.repo,
             dest,
             progress_callback=self.update_progress,
         )
-        self.app.call_from_thread(self._finish)
+        for future in self._as_completed([future]):
+            future.result()
+            self.app.call_from_thread(self._finish)
 
     def _finish(self):
-        self.query_one("#spinner").display = False
-        self.query_one("#download-status").update("Download complete")
+        self._complete("Download complete")
 
     def update_progress(self, percent: float, message: str):
-        def _update():
-            bar = self.query_one("#download-progress")
-            bar.update(progress=percent)
-            self.query_one("#download-status").update(f"{percent:.1f}% {message}")
-        self.app.call_from_thread(_update)
+        self._report(percent, f"{percent:.1f}% {message}")
 
 
-class MultiDownloadScreen(Screen):
+class MultiDownloadScreen(ProgressScreen):
     """Screen to download multiple repositories"""
 
     def __init__(self, repos):
         super().__init__()
         self.repos = repos
+        self._percents = {}
+        # update_progress runs on several clone threads at once
+        self._percents_lock = threading.Lock()
+        self._completed = 0
 
     def compose(self) -> ComposeResult:
         yield Container(
@@ -260,32 +473,44 @@ class MultiDownloadScreen(Screen):
             Label("", id="download-status"),
         )
 
-    def on_mount(self) -> None:
-        self.query_one("#spinner").display = True
-        dest = self.query_one("#location").value or str(self.app.config.get_download_path())
-        thread = threading.Thread(target=self._download, args=(Path(dest),), daemon=True)
-        thread.start()
-
     def _download(self, dest: Path):
-        total = len(self.repos)
-        for index, repo in enumerate(self.repos, start=1):
-            self.app.repo_manager.download_repository(
+        futures = {
+            self.app.download_pool.submit(
+                self.app.repo_manager.download_repository,
                 repo,
                 dest,
-                progress_callback=lambda p, m, r=repo: self.update_progress(index, total, r.name, p, m),
+                progress_callback=partial(self.update_progress, repo.name),
+            ): repo
+            for repo in self.repos
+        }
+        # Every clone runs to the end; one failure must not hide the others
+        failed = []
+        for future in self._as_completed(futures):
+            repo = futures[future]
+            try:
+                future.result()
+            except (Exception, CancelledError) as e:
+                failed.append(f"{repo.name} ({e})")
+                continue
+            self._completed += 1
+            self.update_progress(repo.name, 100.0, "done")
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._finish, failed)
+
+    def _finish(self, failed):
+        if failed:
+            self._complete(
+                f"{len(failed)} of {len(self.repos)} downloads failed: {', '.join(failed)}"
             )
-        self.app.call_from_thread(self._finish)
-
-    def _finish(self):
-        self.query_one("#spinner").display = False
-        self.query_one("#download-status").update("All downloads complete")
-
-    def update_progress(self, idx: int, total: int, name: str, percent: float, message: str):
-        def _update():
-            bar = self.query_one("#download-progress")
-            bar.update(progress=percent)
-            self.query_one("#download-status").update(
-                f"[{idx}/{total}] {name}: {percent:.1f}% {message}"
-            )
-        self.app.call_from_thread(_update)
-
+        else:
+            self._complete("All downloads complete")
+
+    def update_progress(self, name: str, percent: float, message: str):
+        # Repositories download in parallel, so the bar shows their average
+        with self._percents_lock:
+            self._percents[name] = percent
+            overall = sum(self._percents.values()) / len(self.repos)
+        self._report(
+            overall,
+            f"[{self._completed}/{len(self.repos)}] {name}: {percent:.1f}% {message}",
+        )
@@ -0,0 +1,43 @@
+"""
+Debouncing for search-as-you-type inputs
+"""
+from typing import Callable, Optional
+from textual.message_pump import MessagePump
+from textual.timer import Timer
+
+# Seconds a search box must be idle before a local filter runs
+SEARCH_DEBOUNCE = 0.15
+
+# Searches that query a remote service wait longer, so a word typed at
+# normal speed costs one request rather than several
+REMOTE_SEARCH_DEBOUNCE = 0.25
+
+
+class Debouncer:
+    """Run a callback once calls have stopped arriving for a while"""
+
+    def __init__(self, owner: MessagePump, delay: float = SEARCH_DEBOUNCE):
+        self._owner = owner
+        self.delay = delay
+        self._timer: Optional[Timer] = None
+        self._callback: Optional[Callable[[], None]] = None
+
+    def __call__(self, callback: Callable[[], None]) -> None:
+        """Schedule callback, replacing any call still waiting"""
+        self.cancel()
+        self._callback = callback
+        self._timer = self._owner.set_timer(self.delay, self._fire)
+
+    def cancel(self) -> None:
+        """Drop the waiting call, if any"""
+        if self._timer is not None:
+            self._timer.stop()
+        self._timer = None
+        self._callback = None
+
+    def _fire(self) -> None:
+        callback = self._callback
+        self._timer = None
+        self._callback = None
+        if callback is not None:
+            callback()
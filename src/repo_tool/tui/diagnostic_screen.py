@@ -25,6 +25,12 @@ import platform
 import os
 import sys
 import json
+import time
+import asyncio
+import fnmatch
+import functools
+import re
+from collections import deque
 from pathlib import Path
 from datetime import datetime
 
@@ -32,22 +38,92 @@ from ..core.config import Config
 from ..core.messages import MessageCenter
 from ..core.logger import get_logger
 
+# Seconds between automatic resource usage refreshes
+RESOURCE_REFRESH_INTERVAL = 2.0
+# Number of log lines shown, and how far back from the end of the log to read
+LOG_TAIL_LINES = 50
+LOG_TAIL_BYTES = 64 * 1024
+_LOG_LEVEL_RE = re.compile(r"\b(ERROR|WARNING|INFO|DEBUG)\b")
+_LOG_LEVEL_STYLES = {"ERROR": "red", "WARNING": "yellow"}
+
+# Environment variables included in saved reports; everything else is left
+# out to keep reports small and free of secrets
+REPORT_ENV_VARS = (
+    "LANG",
+    "LC_ALL",
+    "TERM",
+    "COLORTERM",
+    "SHELL",
+    "PATH",
+    "VIRTUAL_ENV",
+    "PYTHONPATH",
+)
+
+@functools.lru_cache(maxsize=None)
+def _cpu_model() -> str:
+    """Return the CPU model name, read from /proc/cpuinfo on Linux"""
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/cpuinfo") as f:
+                for line in f:
+                    if line.startswith("model name"):
+                        return line.partition(":")[2].strip()
+        except OSError:
+            pass
+    return platform.processor()
+
+# Interpreter and platform details never change while the process runs
+_SYS_INFO = {
+    "os": f"{platform.system()} {platform.release()}",
+    "machine": platform.machine(),
+    "processor": _cpu_model(),
+    "python_impl": platform.python_implementation(),
+    "python_ver": sys.version.split()[0],
+    "platform": platform.platform(),
+}
+
 class SystemMonitor:
     """System resource monitoring"""
-    
-    @staticmethod
-    def get_cpu_info():
+
+    # Seconds a CPU/memory/disk sample is reused before psutil is queried again
+    CACHE_TTL = 1.0
+
+    def __init__(self):
+        self._cache = {}
+        # Prime psutil's counters so later non-blocking samples have a baseline
+        psutil.cpu_percent(interval=None)
+
+    def _cached(self, key: str, fetch):
+        """Return a recent sample for key, refreshing it once the TTL expires"""
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and now - entry[0] < self.CACHE_TTL:
+            return entry[1]
+        result = fetch()
+        self._cache[key] = (now, result)
+        return result
+
+    def get_cpu_info(self):
         """Get CPU information"""
+        return self._cached("cpu", self._read_cpu_info)
+
+    @staticmethod
+    def _read_cpu_info():
+        count = psutil.cpu_count()
+        freq = psutil.cpu_freq()
         return {
-            "percent": psutil.cpu_percent(interval=1),
-            "count": psutil.cpu_count(),
-            "freq": psutil.cpu_freq().current if psutil.cpu_freq() else None,
-            "load": [x / psutil.cpu_count() * 100 for x in psutil.getloadavg()]
+            "percent": psutil.cpu_percent(interval=None),
+            "count": count,
+            "freq": freq.current if freq else None,
+            "load": [x / count * 100 for x in psutil.getloadavg()]
         }
-        
-    @staticmethod
-    def get_memory_info():
+
+    def get_memory_info(self):
         """Get memory information"""
+        return self._cached("memory", self._read_memory_info)
+
+    @staticmethod
+    def _read_memory_info():
         mem = psutil.virtual_memory()
         return {
             "total": mem.total,
@@ -56,10 +132,13 @@ class SystemMonitor:
             "used": mem.used,
             "free": mem.free
         }
-        
-    @staticmethod
-    def get_disk_info():
+
+    def get_disk_info(self):
         """Get disk information"""
+        return self._cached("disk", self._read_disk_info)
+
+    @staticmethod
+    def _read_disk_info():
         disk = psutil.disk_usage("/")
         return {
             "total": disk.total,
@@ -98,6 +177,15 @@ class DiagnosticScreen(Screen):
         self.message_center = MessageCenter()
         self.logger = get_logger(__name__)
         self.monitor = SystemMonitor()
+        self._data_dir = Path.home() / ".local" / "share" / "repo_tool"
+        self._log_dir = self._data_dir / "logs"
+        self._log_file = self._log_dir / "repo_tool.log"
+        self._db_path = self._data_dir / "messages.db"
+        self._cache_dir = Path.home() / ".cache" / "repo_tool"
+        self._report_dir = self._data_dir / "reports"
+        # Last values drawn, used to skip redraws when nothing changed
+        self._last_usage = {}
+        self._last_log_size = -1
         
     def compose(self) -> ComposeResult:
         """Create child widgets"""
@@ -148,137 +236,171 @@ class DiagnosticScreen(Screen):
             Footer()
         )
         
-    def on_mount(self) -> None:
+    async def on_mount(self) -> None:
         """Handle screen mount"""
-        self.load_system_info()
-        self.load_resource_usage()
-        self.load_component_status()
-        self.load_recent_logs()
+        await self.action_refresh()
+        # Only the cheap resource bars refresh on a timer; logs and component
+        # status are reloaded on an explicit refresh
+        self.set_interval(RESOURCE_REFRESH_INTERVAL, self.load_resource_usage)
+
+    async def _run_blocking(self, func):
+        """Run a blocking call in the default executor"""
+        return await asyncio.get_running_loop().run_in_executor(None, func)
         
     def load_system_info(self) -> None:
         """Load system information"""
-        info = RichLog(id="system-info")
+        text = Text()
         
         # Python information
-        info.write("Python Environment:", style="bold")
-        info.write(f"Version: {sys.version.split()[0]}")
-        info.write(f"Implementation: {platform.python_implementation()}")
-        info.write(f"Path: {sys.executable}")
-        info.write("")
+        text.append("Python Environment:\n", style="bold")
+        text.append(f"Version: {_SYS_INFO['python_ver']}\n")
+        text.append(f"Implementation: {_SYS_INFO['python_impl']}\n")
+        text.append(f"Path: {sys.executable}\n")
+        text.append("\n")
         
         # Platform information
-        info.write("Platform:", style="bold")
-        info.write(f"OS: {platform.system()} {platform.release()}")
-        info.write(f"Machine: {platform.machine()}")
-        info.write(f"Processor: {platform.processor()}")
-        info.write("")
+        text.append("Platform:\n", style="bold")
+        text.append(f"OS: {_SYS_INFO['os']}\n")
+        text.append(f"Machine: {_SYS_INFO['machine']}\n")
+        text.append(f"Processor: {_SYS_INFO['processor']}\n")
+        text.append("\n")
         
         # Environment variables
-        info.write("Environment:", style="bold")
-        info.write(f"LANG: {os.environ.get('LANG', 'Not set')}")
-        info.write(f"TERM: {os.environ.get('TERM', 'Not set')}")
-        info.write(f"SHELL: {os.environ.get('SHELL', 'Not set')}")
-        info.write("")
+        text.append("Environment:\n", style="bold")
+        text.append(f"LANG: {os.environ.get('LANG', 'Not set')}\n")
+        text.append(f"TERM: {os.environ.get('TERM', 'Not set')}\n")
+        text.append(f"SHELL: {os.environ.get('SHELL', 'Not set')}\n")
+        text.append("\n")
         
         # Application paths
-        info.write("Application Paths:", style="bold")
-        info.write(f"Config: {self.config.config_dir}")
-        info.write(f"Cache: {Path.home() / '.cache' / 'repo_tool'}")
-        info.write(f"Logs: {Path.home() / '.local' / 'share' / 'repo_tool' / 'logs'}")
+        text.append("Application Paths:\n", style="bold")
+        text.append(f"Config: {self.config.config_dir}\n")
+        text.append(f"Cache: {self._cache_dir}\n")
+        text.append(f"Logs: {self._log_dir}")
+
+        info = self.query_one("#system-info", RichLog)
+        info.clear()
+        info.write(text)
         
-    def load_resource_usage(self) -> None:
+    async def load_resource_usage(self) -> None:
         """Load resource usage information"""
-        # CPU usage
-        cpu_info = self.monitor.get_cpu_info()
-        self.query_one("#cpu-progress").update(
-            progress=cpu_info["percent"],
-            total=100
-        )
-        
-        # Memory usage
-        mem_info = self.monitor.get_memory_info()
-        self.query_one("#memory-progress").update(
-            progress=mem_info["percent"],
-            total=100
+        cpu_info, mem_info, disk_info = await asyncio.gather(
+            self._run_blocking(self.monitor.get_cpu_info),
+            self._run_blocking(self.monitor.get_memory_info),
+            self._run_blocking(self.monitor.get_disk_info),
         )
+
+        # Only repaint bars whose whole-percent value actually moved
+        for bar_id, percent in (
+            ("#cpu-progress", cpu_info["percent"]),
+            ("#memory-progress", mem_info["percent"]),
+            ("#disk-progress", disk_info["percent"]),
+        ):
+            value = int(percent)
+            if self._last_usage.get(bar_id) == value:
+                continue
+            self._last_usage[bar_id] = value
+            self.query_one(bar_id, ProgressBar).update(
+                progress=percent,
+                total=100
+            )
         
-        # Disk usage
-        disk_info = self.monitor.get_disk_info()
-        self.query_one("#disk-progress").update(
-            progress=disk_info["percent"],
-            total=100
-        )
+    @staticmethod
+    def _check(path) -> tuple:
+        """Return a (status, details) pair for a path using a single stat"""
+        try:
+            os.stat(path)
+            status = "OK"
+        except FileNotFoundError:
+            status = "Missing"
+        return status, str(path)
+
+    def _component_rows(self) -> list:
+        """Collect component status rows"""
+        rows = [
+            ("Configuration", *self._check(self.config.config_file)),
+            ("Message Database", *self._check(self._db_path)),
+            ("Log Directory", *self._check(self._log_dir)),
+        ]
         
-    def load_component_status(self) -> None:
+        # Check tokens
+        services = self.config.get("services", {})
+        for service in ("github", "gitlab", "bitbucket"):
+            token = services.get(service, {}).get("token")
+            rows.append((
+                f"{service.title()} Token",
+                "Configured" if token else "Not configured",
+                "Token present" if token else "No token"
+            ))
+
+        return rows
+
+    async def load_component_status(self) -> None:
         """Load component status information"""
+        rows = await self._run_blocking(self._component_rows)
+
         table = self.query_one("#status-table", DataTable)
         table.clear()
         table.add_columns("Component", "Status", "Details")
-        
-        # Check configuration
-        config_status = "OK" if self.config.config_file.exists() else "Missing"
-        table.add_row(
-            "Configuration",
-            config_status,
-            self.config.config_file
-        )
-        
-        # Check database
-        db_path = Path.home() / ".local" / "share" / "repo_tool" / "messages.db"
-        db_status = "OK" if db_path.exists() else "Missing"
-        table.add_row(
-            "Message Database",
-            db_status,
-            str(db_path)
-        )
-        
-        # Check logs
-        log_path = Path.home() / ".local" / "share" / "repo_tool" / "logs"
-        log_status = "OK" if log_path.exists() else "Missing"
-        table.add_row(
-            "Log Directory",
-            log_status,
-            str(log_path)
-        )
-        
-        # Check tokens
-        for service in ["github", "gitlab", "bitbucket"]:
-            token = self.config.get(f"services.{service}.token")
-            status = "Configured" if token else "Not configured"
-            table.add_row(
-                f"{service.title()} Token",
-                status,
-                "Token present" if token else "No token"
-            )
+        table.add_rows(rows)
             
-    def load_recent_logs(self) -> None:
+    def _log_size(self):
+        """Return the log file size, or None if there is no log file"""
+        try:
+            return os.stat(self._log_file).st_size
+        except FileNotFoundError:
+            return None
+
+    def _read_recent_logs(self):
+        """Return the last log lines, or None if there is no log file"""
+        if not self._log_file.exists():
+            return None
+        with open(self._log_file, "rb") as f:
+            # Only the end of the file is needed, so skip straight to it and
+            # drop the partial line we land in
+            size = os.fstat(f.fileno()).st_size
+            if size > LOG_TAIL_BYTES:
+                f.seek(size - LOG_TAIL_BYTES)
+                f.readline()
+            last_lines = deque(f, maxlen=LOG_TAIL_LINES)
+        return [line.decode("utf-8", errors="replace") for line in last_lines]
+
+    async def load_recent_logs(self) -> None:
         """Load recent log entries"""
         log_view = self.query_one("#log-view", RichLog)
-        log_view.clear()
         
         try:
-            log_path = Path.home() / ".local" / "share" / "repo_tool" / "logs" / "repo_tool.log"
-            if log_path.exists():
-                with open(log_path) as f:
-                    last_lines = list(f)[-50:]  # Last 50 lines
-                    for line in last_lines:
-                        if "ERROR" in line:
-                            log_view.write(line.strip(), style="red")
-                        elif "WARNING" in line:
-                            log_view.write(line.strip(), style="yellow")
-                        else:
-                            log_view.write(line.strip())
+            # An unchanged file size means nothing new was logged
+            size = await self._run_blocking(self._log_size)
+            if size == self._last_log_size:
+                return
+            self._last_log_size = size
+
+            last_lines = await self._run_blocking(self._read_recent_logs)
+            log_view.clear()
+            if last_lines is not None:
+                text = Text()
+                for line in last_lines:
+                    # The level column precedes the message, so the first
+                    # level word on the line is the record's level
+                    match = _LOG_LEVEL_RE.search(line)
+                    style = _LOG_LEVEL_STYLES.get(match.group(1)) if match else None
+                    text.append(line.strip() + "\n", style=style)
+                text.rstrip()
+                log_view.write(text)
             else:
-                log_view.write("No log file found", style="italic")
+                log_view.write(Text("No log file found", style="italic"))
         except Exception as e:
-            log_view.write(f"Error reading logs: {e}", style="red")
+            log_view.write(Text(f"Error reading logs: {e}", style="red"))
             
-    def action_refresh(self) -> None:
+    async def action_refresh(self) -> None:
         """Refresh all information"""
         self.load_system_info()
-        self.load_resource_usage()
-        self.load_component_status()
-        self.load_recent_logs()
+        await asyncio.gather(
+            self.load_resource_usage(),
+            self.load_component_status(),
+            self.load_recent_logs(),
+        )
         
     def action_save(self) -> None:
         """Save diagnostic report"""
@@ -287,9 +409,9 @@ class DiagnosticScreen(Screen):
                 "timestamp": datetime.now().isoformat(),
                 "system": {
                     "python": sys.version,
-                    "platform": platform.platform(),
-                    "machine": platform.machine(),
-                    "processor": platform.processor()
+                    "platform": _SYS_INFO["platform"],
+                    "machine": _SYS_INFO["machine"],
+                    "processor": _SYS_INFO["processor"]
                 },
                 "resources": {
                     "cpu": self.monitor.get_cpu_info(),
@@ -298,15 +420,18 @@ class DiagnosticScreen(Screen):
                     "network": self.monitor.get_network_info()
                 },
                 "config": self.config.config,
-                "environment": dict(os.environ)
+                "environment": {
+                    name: os.environ[name]
+                    for name in REPORT_ENV_VARS
+                    if name in os.environ
+                }
             }
             
-            report_dir = Path.home() / ".local" / "share" / "repo_tool" / "reports"
-            report_dir.mkdir(parents=True, exist_ok=True)
+            self._report_dir.mkdir(parents=True, exist_ok=True)
             
-            report_path = report_dir / f"diagnostic_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            report_path = self._report_dir / f"diagnostic_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
             with open(report_path, 'w') as f:
-                json.dump(report, f, indent=2)
+                json.dump(report, f, separators=(",", ":"))
                 
             self.notify(f"Report saved to {report_path}", severity="success")
         except Exception as e:
@@ -321,15 +446,20 @@ class DiagnosticScreen(Screen):
         """Clean up temporary files and optimize storage"""
         try:
             # Clear old logs
-            log_dir = Path.home() / ".local" / "share" / "repo_tool" / "logs"
-            for log in log_dir.glob("*.log.*"):
-                if log.stat().st_mtime < (datetime.now().timestamp() - 30 * 86400):
-                    log.unlink()
+            cutoff = time.time() - 30 * 86400
+            if os.path.isdir(self._log_dir):
+                with os.scandir(self._log_dir) as entries:
+                    for entry in entries:
+                        if (
+                            entry.is_file(follow_symlinks=False)
+                            and fnmatch.fnmatch(entry.name, "*.log.*")
+                            and entry.stat(follow_symlinks=False).st_mtime < cutoff
+                        ):
+                            os.unlink(entry.path)
                     
             # Clear cache
-            cache_dir = Path.home() / ".cache" / "repo_tool"
-            if cache_dir.exists():
-                for item in cache_dir.iterdir():
+            if self._cache_dir.exists():
+                for item in self._cache_dir.iterdir():
                     if item.is_file():
                         item.unlink()
                         
@@ -344,10 +474,10 @@ class DiagnosticScreen(Screen):
         """Return to previous screen"""
         self.dismiss()
         
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses"""
         if event.button.id == "refresh":
-            self.action_refresh()
+            await self.action_refresh()
         elif event.button.id == "save":
             self.action_save()
         elif event.button.id == "test":
@@ -16,12 +16,50 @@ from textual.widgets import (
 )
 from textual.binding import Binding
 from textual.message import Message
+from rich.console import Group, RenderableType
 from rich.markdown import Markdown
 from rich.syntax import Syntax
 from rich.table import Table
+from rich.text import Text
 from pathlib import Path
+from typing import List
+import functools
 import yaml
 
+from .debounce import Debouncer
+
+# libyaml's C loader is much faster; fall back when PyYAML was built without it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Example code shown with an error, by error code
+_ERROR_EXAMPLES = {
+    "AUTH001": """
+try:
+    token_manager.validate_token("github", token)
+except AuthenticationError as e:
+    logger.error(f"Token validation failed: {e}")
+    # Handle token validation failure
+""",
+    "NET001": """
+try:
+    response = requests.get(api_url, timeout=30)
+    response.raise_for_status()
+except requests.exceptions.RequestException as e:
+    logger.error(f"API request failed: {e}")
+    # Handle connection failure
+""",
+    "REPO001": """
+try:
+    repo = github.get_repo(f"{owner}/{repo_name}")
+except github.GithubException as e:
+    if e.status == 404:
+        logger.error(f"Repository not found: {owner}/{repo_name}")
+        # Handle repository not found
+    else:
+        raise
+"""
+}
+
 class ErrorInfo:
     """Error information structure"""
     
@@ -43,6 +81,99 @@ class ErrorInfo:
             solutions=data.get("solutions", [])
         )
 
+@functools.lru_cache(maxsize=1)
+def _load_error_docs() -> dict:
+    """Load error documentation, parsing errors.yaml only once per process"""
+    try:
+        docs_path = Path(__file__).parent.parent / "data" / "errors.yaml"
+        with open(docs_path) as f:
+            data = yaml.load(f, Loader=_YAML_LOADER)
+            
+        errors = {}
+        for category, items in data.items():
+            category_errors = {}
+            for item in items:
+                error = ErrorInfo.from_dict(item)
+                category_errors[error.code] = error
+            errors[category] = category_errors
+            
+        return errors
+    except Exception as e:
+        return {
+            "Authentication": {
+                "AUTH001": ErrorInfo(
+                    code="AUTH001",
+                    title="Token validation failed",
+                    description="Failed to validate service authentication token",
+                    causes=[
+                        "Invalid token format",
+                        "Expired token",
+                        "Insufficient permissions"
+                    ],
+                    solutions=[
+                        "Check token in service settings",
+                        "Generate new token with required scopes",
+                        "Verify token has not expired"
+                    ]
+                )
+            },
+            "Network": {
+                "NET001": ErrorInfo(
+                    code="NET001",
+                    title="Connection failed",
+                    description="Failed to connect to service API",
+                    causes=[
+                        "Network connectivity issues",
+                        "Service API unreachable",
+                        "Invalid API endpoint"
+                    ],
+                    solutions=[
+                        "Check network connection",
+                        "Verify service status",
+                        "Check API endpoint configuration"
+                    ]
+                )
+            },
+            "Repository": {
+                "REPO001": ErrorInfo(
+                    code="REPO001",
+                    title="Repository not found",
+                    description="Unable to find specified repository",
+                    causes=[
+                        "Repository does not exist",
+                        "Insufficient permissions",
+                        "Invalid repository name"
+                    ],
+                    solutions=[
+                        "Verify repository exists",
+                        "Check access permissions",
+                        "Verify repository name format"
+                    ]
+                )
+            }
+        }
+
+@functools.lru_cache(maxsize=128)
+def _render_error(error: ErrorInfo, example: str) -> Group:
+    """Build the details page for an error, once per error"""
+    parts: List[RenderableType] = [
+        Text(f"# {error.code}: {error.title}", style="bold"),
+        Text(f"\n{error.description}\n"),
+        Text("## Possible Causes", style="bold yellow"),
+        *(Text(f"- {cause}") for cause in error.causes),
+        Text(),
+        Text("## Solutions", style="bold green"),
+        *(Text(f"{i}. {solution}") for i, solution in enumerate(error.solutions, 1)),
+        Text(),
+    ]
+    
+    # Add example if available
+    if example:
+        parts.append(Text("## Example", style="bold blue"))
+        parts.append(Syntax(example.strip(), "python"))
+        
+    return Group(*parts)
+
 class ErrorScreen(Screen):
     """Error documentation and troubleshooting screen"""
     
@@ -55,8 +186,24 @@ class ErrorScreen(Screen):
     
     def __init__(self):
         super().__init__()
-        self.errors = self.load_error_docs()
+        self.errors = _load_error_docs()
         self.current_error = None
+        self._search_debounce = Debouncer(self)
+        self._leaf_nodes = {}
+        self._category_nodes = {}
+        # (category, code, error) for every error, flattened once so hot
+        # paths don't walk the nested category dicts
+        self._flat_errors = [
+            (category, error_code, error)
+            for category, errors in self.errors.items()
+            for error_code, error in errors.items()
+        ]
+        # Lower-cased "code\0title\0description" parallel to _flat_errors, so
+        # a keystroke is a single substring test per error
+        self._search_index = [
+            f"{error_code}\0{error.title}\0{error.description}".lower()
+            for _, error_code, error in self._flat_errors
+        ]
         
     def compose(self) -> ComposeResult:
         """Create child widgets"""
@@ -91,74 +238,7 @@ class ErrorScreen(Screen):
         
     def load_error_docs(self) -> dict:
         """Load error documentation"""
-        try:
-            docs_path = Path(__file__).parent.parent / "data" / "errors.yaml"
-            with open(docs_path) as f:
-                data = yaml.safe_load(f)
-                
-            errors = {}
-            for category, items in data.items():
-                category_errors = {}
-                for item in items:
-                    error = ErrorInfo.from_dict(item)
-                    category_errors[error.code] = error
-                errors[category] = category_errors
-                
-            return errors
-        except Exception as e:
-            return {
-                "Authentication": {
-                    "AUTH001": ErrorInfo(
-                        code="AUTH001",
-                        title="Token validation failed",
-                        description="Failed to validate service authentication token",
-                        causes=[
-                            "Invalid token format",
-                            "Expired token",
-                            "Insufficient permissions"
-                        ],
-                        solutions=[
-                            "Check token in service settings",
-                            "Generate new token with required scopes",
-                            "Verify token has not expired"
-                        ]
-                    )
-                },
-                "Network": {
-                    "NET001": ErrorInfo(
-                        code="NET001",
-                        title="Connection failed",
-                        description="Failed to connect to service API",
-                        causes=[
-                            "Network connectivity issues",
-                            "Service API unreachable",
-                            "Invalid API endpoint"
-                        ],
-                        solutions=[
-                            "Check network connection",
-                            "Verify service status",
-                            "Check API endpoint configuration"
-                        ]
-                    )
-                },
-                "Repository": {
-                    "REPO001": ErrorInfo(
-                        code="REPO001",
-                        title="Repository not found",
-                        description="Unable to find specified repository",
-                        causes=[
-                            "Repository does not exist",
-                            "Insufficient permissions",
-                            "Invalid repository name"
-                        ],
-                        solutions=[
-                            "Verify repository exists",
-                            "Check access permissions",
-                            "Verify repository name format"
-                        ]
-                    )
-                }
-            }
+        return _load_error_docs()
             
     def on_mount(self) -> None:
         """Handle screen mount"""
@@ -166,117 +246,100 @@ class ErrorScreen(Screen):
         
     def build_error_tree(self) -> None:
         """Build error tree"""
+        self._populate_tree({
+            (category, error_code) for category, error_code, _ in self._flat_errors
+        })
+
+    def _populate_tree(self, keys: set) -> None:
+        """Rebuild the error tree with the given (category, code) keys"""
         tree = self.query_one("#error-tree", Tree)
         tree.clear()
+        self._leaf_nodes = {}
+        self._category_nodes = {}
         
-        for category, errors in self.errors.items():
-            category_node = tree.root.add(category)
-            for error_code, error in errors.items():
-                category_node.add_leaf(f"{error_code}: {error.title}")
+        for category, error_code, error in self._flat_errors:
+            if (category, error_code) in keys:
+                category_node = self._category_nodes.get(category)
+                if category_node is None:
+                    category_node = self._category_nodes[category] = tree.root.add(
+                        category, data=category
+                    )
+                self._leaf_nodes[category, error_code] = category_node.add_leaf(
+                    f"{error_code}: {error.title}", data=error
+                )
                 
     def show_error_details(self, error: ErrorInfo) -> None:
         """Show error details"""
+        # One write renders the whole page instead of a line at a time
         details = self.query_one("#error-details", RichLog)
         details.clear()
-        
-        details.write(f"# {error.code}: {error.title}\n", style="bold")
-        details.write(f"\n{error.description}\n\n")
-        
-        details.write("## Possible Causes\n", style="bold yellow")
-        for cause in error.causes:
-            details.write(f"- {cause}")
-        details.write("\n")
-        
-        details.write("## Solutions\n", style="bold green")
-        for i, solution in enumerate(error.solutions, 1):
-            details.write(f"{i}. {solution}")
-        details.write("\n")
-        
-        # Add example if available
-        example = self.get_error_example(error.code)
-        if example:
-            details.write("## Example\n", style="bold blue")
-            details.write("```python\n")
-            details.write(example)
-            details.write("\n```")
+        details.write(_render_error(error, self.get_error_example(error.code)))
             
     def get_error_example(self, error_code: str) -> str:
         """Get example code for error"""
-        examples = {
-            "AUTH001": """
-try:
-    token_manager.validate_token("github", token)
-except AuthenticationError as e:
-    logger.error(f"Token validation failed: {e}")
-    # Handle token validation failure
-""",
-            "NET001": """
-try:
-    response = requests.get(api_url, timeout=30)
-    response.raise_for_status()
-except requests.exceptions.RequestException as e:
-    logger.error(f"API request failed: {e}")
-    # Handle connection failure
-""",
-            "REPO001": """
-try:
-    repo = github.get_repo(f"{owner}/{repo_name}")
-except github.GithubException as e:
-    if e.status == 404:
-        logger.error(f"Repository not found: {owner}/{repo_name}")
-        # Handle repository not found
-    else:
-        raise
-"""
-        }
-        return examples.get(error_code)
+        return _ERROR_EXAMPLES.get(error_code)
         
     def on_tree_node_selected(self, event: Tree.NodeSelected) -> None:
         """Handle tree node selection"""
-        if ":" in event.node.label:
-            error_code = event.node.label.split(":")[0].strip()
-            category = event.node.parent.label
-            if category in self.errors and error_code in self.errors[category]:
-                self.current_error = self.errors[category][error_code]
-                self.show_error_details(self.current_error)
+        error = event.node.data
+        if isinstance(error, ErrorInfo):
+            self.current_error = error
+            self.show_error_details(error)
                 
     def on_input_changed(self, event: Input.Changed) -> None:
-        """Handle search input changes"""
-        search = event.value.lower()
-        tree = self.query_one("#error-tree", Tree)
-        tree.clear()
-        
-        for category, errors in self.errors.items():
-            category_node = None
-            for error_code, error in errors.items():
-                if (search in error_code.lower() or
-                    search in error.title.lower() or
-                    search in error.description.lower()):
-                    if category_node is None:
-                        category_node = tree.root.add(category)
-                    category_node.add_leaf(f"{error_code}: {error.title}")
+        """Handle search input changes once typing pauses"""
+        self._search_debounce(functools.partial(self._apply_search, event.value))
+
+    def _apply_search(self, value: str) -> None:
+        """Update the error tree to show only errors matching value"""
+        search = value.lower()
+        matches = {
+            (category, error_code)
+            for (category, error_code, _), haystack in zip(self._flat_errors, self._search_index)
+            if search in haystack
+        }
+        shown = self._leaf_nodes.keys()
+        if matches == shown:
+            return
+        if not matches <= shown:
+            self._populate_tree(matches)
+            return
+            
+        # Narrowing the query (the common case while typing) only drops
+        # nodes, so remove those instead of rebuilding the whole tree
+        for key in shown - matches:
+            self._leaf_nodes.pop(key).remove()
+        for category, category_node in list(self._category_nodes.items()):
+            if not category_node.children:
+                del self._category_nodes[category]
+                category_node.remove()
                     
     def action_help(self) -> None:
         """Show help information"""
         details = self.query_one("#error-details", RichLog)
         details.clear()
-        
-        details.write("# Using Error Documentation\n\n", style="bold")
-        details.write("## Navigation\n", style="bold yellow")
-        details.write("- Use arrow keys to navigate error tree\n")
-        details.write("- Press Enter to select an error\n")
-        details.write("- Use / or s to search errors\n")
-        details.write("- Press Escape to go back\n\n")
-        
-        details.write("## Search Tips\n", style="bold green")
-        details.write("- Search by error code (e.g., AUTH001)\n")
-        details.write("- Search by keywords in title or description\n")
-        details.write("- Search is case-insensitive\n\n")
-        
-        details.write("## Error Categories\n", style="bold blue")
-        details.write("- Authentication: Token and credential issues\n")
-        details.write("- Network: Connection and API problems\n")
-        details.write("- Repository: Repository access and management\n")
+        details.write(Group(
+            Text("# Using Error Documentation\n", style="bold"),
+            Text("## Navigation", style="bold yellow"),
+            Text(
+                "- Use arrow keys to navigate error tree\n"
+                "- Press Enter to select an error\n"
+                "- Use / or s to search errors\n"
+                "- Press Escape to go back\n"
+            ),
+            Text("## Search Tips", style="bold green"),
+            Text(
+                "- Search by error code (e.g., AUTH001)\n"
+                "- Search by keywords in title or description\n"
+                "- Search is case-insensitive\n"
+            ),
+            Text("## Error Categories", style="bold blue"),
+            Text(
+                "- Authentication: Token and credential issues\n"
+                "- Network: Connection and API problems\n"
+                "- Repository: Repository access and management"
+            ),
+        ))
         
     def action_back(self) -> None:
         """Return to previous screen"""
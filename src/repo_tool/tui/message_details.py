@@ -14,8 +14,14 @@ from textual.widgets import (
 from textual.binding import Binding
 from rich.syntax import Syntax
 from ..core.messages import Message, MessageType
+from pathlib import Path
 import json
 
+try:
+    import pyperclip
+except ImportError:
+    pyperclip = None
+
 class MessageDetailsScreen(ModalScreen[bool]):
     """Detailed message view screen"""
     
@@ -33,6 +39,17 @@ class MessageDetailsScreen(ModalScreen[bool]):
         """
         super().__init__()
         self.message = message
+        # The message doesn't change while the popup is open, so copy and
+        # export share one serialization
+        self._details = {
+            "time": message.timestamp.isoformat(),
+            "type": message.type.value,
+            "source": message.source,
+            "message": message.text,
+            "progress": message.progress,
+            "details": message.details
+        }
+        self._details_json = json.dumps(self._details, indent=2)
         
     def compose(self) -> ComposeResult:
         """Create child widgets"""
@@ -47,12 +64,12 @@ class MessageDetailsScreen(ModalScreen[bool]):
                     # Message basics
                     Container(
                         Label("Time:", classes="detail-label"),
-                        Label(self.message.timestamp.strftime("%Y-%m-%d %H:%M:%S"), classes="detail-value"),
+                        Label(self.message.formatted_time, classes="detail-value"),
                         classes="detail-row"
                     ),
                     Container(
                         Label("Type:", classes="detail-label"),
-                        Label(self.message.type.value.upper(), classes="detail-value"),
+                        Label(self.message.type_upper, classes="detail-value"),
                         classes="detail-row"
                     ),
                     Container(
@@ -108,27 +125,15 @@ class MessageDetailsScreen(ModalScreen[bool]):
             
     def action_copy(self) -> None:
         """Copy message details to clipboard"""
-        details = {
-            "time": self.message.timestamp.isoformat(),
-            "type": self.message.type.value,
-            "source": self.message.source,
-            "message": self.message.text,
-            "progress": self.message.progress,
-            "details": self.message.details
-        }
-        
-        try:
-            import pyperclip
-            pyperclip.copy(json.dumps(details, indent=2))
-            self.notify("Message details copied to clipboard", severity="success")
-        except ImportError:
+        if pyperclip is None:
             self.notify("pyperclip not installed - cannot copy to clipboard", severity="error")
+            return
+            
+        pyperclip.copy(self._details_json)
+        self.notify("Message details copied to clipboard", severity="success")
             
     def action_export(self) -> None:
         """Export message details to file"""
-        from pathlib import Path
-        import json
-        
         try:
             export_dir = Path.home() / ".local" / "share" / "repo_tool" / "exports"
             export_dir.mkdir(parents=True, exist_ok=True)
@@ -136,17 +141,8 @@ class MessageDetailsScreen(ModalScreen[bool]):
             filename = f"message_{self.message.timestamp.strftime('%Y%m%d_%H%M%S')}.json"
             export_path = export_dir / filename
             
-            details = {
-                "time": self.message.timestamp.isoformat(),
-                "type": self.message.type.value,
-                "source": self.message.source,
-                "message": self.message.text,
-                "progress": self.message.progress,
-                "details": self.message.details
-            }
-            
             with open(export_path, 'w') as f:
-                json.dump(details, f, indent=2)
+                f.write(self._details_json)
                 
             self.notify(f"Message exported to {export_path}", severity="success")
         except Exception as e:
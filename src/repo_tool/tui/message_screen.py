@@ -14,6 +14,7 @@ from textual.widgets import (
 )
 from textual.binding import Binding
 from datetime import datetime, timedelta
+from typing import Optional
 from ..core.messages import MessageCenter, MessageType, Message
 
 class MessageCenterScreen(Screen):
@@ -56,8 +57,10 @@ class MessageCenterScreen(Screen):
         
     def on_mount(self) -> None:
         """Handle screen mount"""
-        table = self.query_one("#message-table", DataTable)
-        table.add_columns(
+        self._table = self.query_one("#message-table", DataTable)
+        self._status = self.query_one("#status", Label)
+        self._tabs = self.query_one("#message-tabs", Tabs)
+        self._table.add_columns(
             "Time",
             "Type",
             "Source",
@@ -66,31 +69,36 @@ class MessageCenterScreen(Screen):
         )
         self.load_messages()
         
-    def load_messages(self, message_type: MessageType = None) -> None:
-        """Load messages into the table"""
-        table = self.query_one("#message-table", DataTable)
+    def load_messages(self, message_type: MessageType = None, now: Optional[datetime] = None) -> None:
+        """Load messages into the table
+        
+        Args:
+            message_type: Only show messages of this type
+            now: Current time, when the caller already has it
+        """
+        table = self._table
         table.clear()
         
         # Get messages from the last 7 days by default
-        since = datetime.now() - timedelta(days=7)
+        since = (now or datetime.now()) - timedelta(days=7)
         messages = self.message_center.get_messages(
             type=message_type,
             since=since
         )
         
-        for msg in messages:
-            progress = f"{msg.progress:.1f}%" if msg.progress is not None else ""
-            table.add_row(
-                msg.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
-                msg.type.value.upper(),
+        # Rows are added in one call rather than one add_row per message
+        table.add_rows(
+            (
+                msg.formatted_time,
+                msg.type_upper,
                 msg.source,
                 msg.text,
-                progress,
-                key=str(msg.timestamp.timestamp())
+                f"{msg.progress:.1f}%" if msg.progress is not None else ""
             )
+            for msg in messages
+        )
             
-        status = self.query_one("#status", Label)
-        status.update(f"Showing {len(messages)} messages")
+        self._status.update(f"Showing {len(messages)} messages")
         
     def on_tabs_tab_activated(self, event: Tabs.TabActivated) -> None:
         """Handle tab changes"""
@@ -102,23 +110,24 @@ class MessageCenterScreen(Screen):
             
     def action_clear(self) -> None:
         """Clear messages"""
-        tab = self.query_one("Tabs").active_tab
-        message_type = None if tab.id == "all" else MessageType(tab.id)
+        tab_id = self._tabs.active
+        message_type = None if tab_id == "all" else MessageType(tab_id)
         
         # Clear messages older than 7 days
-        older_than = datetime.now() - timedelta(days=7)
+        now = datetime.now()
+        older_than = now - timedelta(days=7)
         cleared = self.message_center.clear_messages(
             older_than=older_than,
             type=message_type
         )
         
         self.notify(f"Cleared {cleared} messages", severity="info")
-        self.load_messages(message_type)
+        self.load_messages(message_type, now)
         
     def action_refresh(self) -> None:
         """Refresh message list"""
-        tab = self.query_one("Tabs").active_tab
-        message_type = None if tab.id == "all" else MessageType(tab.id)
+        tab_id = self._tabs.active
+        message_type = None if tab_id == "all" else MessageType(tab_id)
         self.load_messages(message_type)
         
     def action_back(self) -> None:
@@ -127,8 +136,7 @@ class MessageCenterScreen(Screen):
         
     def action_filter(self) -> None:
         """Toggle filter input"""
-        table = self.query_one("#message-table", DataTable)
-        table.focus()
+        self._table.focus()
         
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle row selection"""
@@ -13,7 +13,9 @@ from textual.widgets import (
 )
 from textual.binding import Binding
 from datetime import datetime, timedelta
-from collections import defaultdict
+from itertools import islice
+from pathlib import Path
+import json
 from ..core.messages import MessageCenter, MessageType
 
 class MessageStatsScreen(Screen):
@@ -29,6 +31,9 @@ class MessageStatsScreen(Screen):
         super().__init__()
         self.message_center = MessageCenter()
         self.view_mode = "daily"  # or "hourly"
+        self._stats_cache_key = None
+        self._stats_cache = None
+        self._last_stats = None
         
     def compose(self) -> ComposeResult:
         """Create child widgets"""
@@ -71,56 +76,62 @@ class MessageStatsScreen(Screen):
         
     def on_mount(self) -> None:
         """Handle screen mount"""
+        self._type_chart = self.query_one("#type-chart", BarChart)
+        self._volume_chart = self.query_one("#volume-chart", LineChart)
+        self._source_chart = self.query_one("#source-chart", BarChart)
+        self._stats_table = self.query_one("#stats-table", DataTable)
+        self._daily_button = self.query_one("#daily-view", Button)
+        self._hourly_button = self.query_one("#hourly-view", Button)
         self.load_statistics()
         
     def get_message_stats(self):
-        """Calculate message statistics"""
+        """Calculate message statistics, reusing the last result while the
+        view mode, the hour and stored messages are unchanged"""
+        # Stats cover exactly the last 7 days, like the message list; the
+        # key only changes hourly so a result is reused for up to an hour
         now = datetime.now()
-        week_ago = now - timedelta(days=7)
-        messages = self.message_center.get_messages(since=week_ago)
-        
-        # Type distribution
-        type_counts = defaultdict(int)
-        # Source distribution
-        source_counts = defaultdict(int)
-        # Volume over time
-        volume_by_time = defaultdict(int)
+        key = (
+            self.view_mode,
+            now.replace(minute=0, second=0, microsecond=0),
+            self.message_center.version(),
+        )
+        if key != self._stats_cache_key:
+            self._stats_cache = self._compute_message_stats(now - timedelta(days=7))
+            self._stats_cache_key = key
+        return self._stats_cache
         
-        for msg in messages:
-            type_counts[msg.type.value] += 1
-            source_counts[msg.source] += 1
-            
-            if self.view_mode == "daily":
-                time_key = msg.timestamp.strftime("%Y-%m-%d")
-            else:
-                time_key = msg.timestamp.strftime("%Y-%m-%d %H:00")
-            volume_by_time[time_key] += 1
+    def _compute_message_stats(self, week_ago: datetime):
+        """Calculate message statistics for messages since week_ago"""
+        # Counts are grouped by the database; only the aggregates come back
+        type_counts = self.message_center.aggregate("type", since=week_ago)
+        source_counts = self.message_center.aggregate("source", since=week_ago)
+        volume_by_time = self.message_center.aggregate(
+            "day" if self.view_mode == "daily" else "hour",
+            since=week_ago
+        )
+        total_messages = sum(type_counts.values())
             
         return {
-            "type_counts": dict(type_counts),
-            "source_counts": dict(sorted(
-                source_counts.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:10]),  # Top 10 sources
-            "volume_by_time": dict(sorted(volume_by_time.items())),
-            "total_messages": len(messages),
+            "type_counts": type_counts,
+            "source_counts": dict(islice(source_counts.items(), 10)),  # Top 10 sources
+            "volume_by_time": volume_by_time,
+            "total_messages": total_messages,
             "unique_sources": len(source_counts),
-            "error_rate": (type_counts.get("error", 0) / len(messages)) if messages else 0
+            "error_rate": (type_counts.get("error", 0) / total_messages) if total_messages else 0
         }
         
     def load_statistics(self) -> None:
         """Load and display statistics"""
-        stats = self.get_message_stats()
+        stats = self._last_stats = self.get_message_stats()
         
         # Update type distribution chart
-        type_chart = self.query_one("#type-chart", BarChart)
+        type_chart = self._type_chart
         type_chart.clear()
         for msg_type, count in stats["type_counts"].items():
             type_chart.add_value(label=msg_type.upper(), value=count)
             
         # Update volume chart
-        volume_chart = self.query_one("#volume-chart", LineChart)
+        volume_chart = self._volume_chart
         volume_chart.clear()
         volume_chart.add_series(
             "Messages",
@@ -129,27 +140,22 @@ class MessageStatsScreen(Screen):
         )
         
         # Update source chart
-        source_chart = self.query_one("#source-chart", BarChart)
+        source_chart = self._source_chart
         source_chart.clear()
         for source, count in stats["source_counts"].items():
             source_chart.add_value(label=source, value=count)
             
         # Update summary table
-        table = self.query_one("#stats-table", DataTable)
+        table = self._stats_table
         table.clear()
         table.add_columns("Metric", "Value")
         table.add_rows([
             ("Total Messages", str(stats["total_messages"])),
             ("Unique Sources", str(stats["unique_sources"])),
             ("Error Rate", f"{stats['error_rate']:.2%}"),
-            ("Most Common Type", max(
-                stats["type_counts"].items(),
-                key=lambda x: x[1]
-            )[0].upper() if stats["type_counts"] else "N/A"),
-            ("Most Active Source", max(
-                stats["source_counts"].items(),
-                key=lambda x: x[1]
-            )[0] if stats["source_counts"] else "N/A")
+            # Both count dicts are ordered most common first
+            ("Most Common Type", next(iter(stats["type_counts"]), "N/A").upper()),
+            ("Most Active Source", next(iter(stats["source_counts"]), "N/A"))
         ])
         
     def action_refresh(self) -> None:
@@ -170,21 +176,18 @@ class MessageStatsScreen(Screen):
         if event.button.id == "daily-view":
             self.view_mode = "daily"
             event.button.variant = "primary"
-            self.query_one("#hourly-view", Button).variant = "default"
+            self._hourly_button.variant = "default"
             self.load_statistics()
         elif event.button.id == "hourly-view":
             self.view_mode = "hourly"
             event.button.variant = "primary"
-            self.query_one("#daily-view", Button).variant = "default"
+            self._daily_button.variant = "default"
             self.load_statistics()
         elif event.button.id == "export-stats":
             self.export_statistics()
             
     def export_statistics(self) -> None:
         """Export statistics to file"""
-        from pathlib import Path
-        import json
-        
         try:
             export_dir = Path.home() / ".local" / "share" / "repo_tool" / "exports"
             export_dir.mkdir(parents=True, exist_ok=True)
@@ -192,7 +195,8 @@ class MessageStatsScreen(Screen):
             filename = f"message_stats_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
             export_path = export_dir / filename
             
-            stats = self.get_message_stats()
+            # Export what is on screen rather than querying again
+            stats = dict(self._last_stats or self.get_message_stats())
             # Convert datetime keys to strings
             stats["volume_by_time"] = {
                 str(k): v for k, v in stats["volume_by_time"].items()
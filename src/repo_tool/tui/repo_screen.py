@@ -13,12 +13,58 @@ from textual.widgets import (
     RadioSet,
     RadioButton,
     ListView,
+    ListItem,
     LoadingIndicator
 )
 from textual.binding import Binding
 from textual.message import Message
+from textual.worker import get_current_worker
+from functools import partial
+from typing import Dict, List, Tuple
+import time
 
 from ..core.repo_ops import RepositoryOperations, RepoCreateOptions, RepoInfo
+from .debounce import REMOTE_SEARCH_DEBOUNCE, Debouncer
+
+# Seconds a search result is reused before asking the service again
+SEARCH_CACHE_TTL = 30.0
+
+# Most search results kept at once; the oldest are dropped first
+SEARCH_CACHE_SIZE = 64
+
+# (service, query) -> (monotonic time fetched, results); module level so the
+# results outlive a single RepoManagementScreen
+_search_cache: Dict[Tuple[str, str], Tuple[float, List[RepoInfo]]] = {}
+
+def _cache_search(service: str, query: str, repos: List[RepoInfo]) -> None:
+    """Remember search results, dropping expired and excess entries"""
+    now = time.monotonic()
+    for key in [key for key, (fetched, _) in _search_cache.items()
+                if now - fetched >= SEARCH_CACHE_TTL]:
+        del _search_cache[key]
+    _search_cache.pop((service, query), None)
+    while len(_search_cache) >= SEARCH_CACHE_SIZE:
+        del _search_cache[next(iter(_search_cache))]
+    _search_cache[service, query] = (now, repos)
+
+def _invalidate_search_cache(service: str) -> None:
+    """Forget cached search results for a service"""
+    for key in [key for key in _search_cache if key[0] == service]:
+        _search_cache.pop(key, None)
+
+def _csv(value: str) -> list:
+    """Split a comma-separated field into its non-empty, stripped items"""
+    return [item for item in (part.strip() for part in value.split(",")) if item]
+
+# (label, value) options offered by CreateRepoDialog
+_LICENSES = tuple((lic, lic) for lic in (
+    "mit", "apache-2.0", "gpl-3.0",
+    "bsd-2-clause", "bsd-3-clause", "unlicense"
+))
+_GITIGNORES = tuple((gi, gi) for gi in (
+    "Python", "Node", "Go", "Rust",
+    "Java", "Ruby", "C++", "C"
+))
 
 class CreateRepoDialog(Screen):
     """Dialog for creating a new repository"""
@@ -34,22 +80,8 @@ class CreateRepoDialog(Screen):
             Input(placeholder="Repository name", id="name"),
             Input(placeholder="Description (optional)", id="description"),
             Switch("Private repository", id="private"),
-            Select(
-                ((lic, lic) for lic in [
-                    "mit", "apache-2.0", "gpl-3.0",
-                    "bsd-2-clause", "bsd-3-clause", "unlicense"
-                ]),
-                prompt="Choose a license",
-                id="license"
-            ),
-            Select(
-                ((gi, gi) for gi in [
-                    "Python", "Node", "Go", "Rust",
-                    "Java", "Ruby", "C++", "C"
-                ]),
-                prompt="Choose .gitignore template",
-                id="gitignore"
-            ),
+            Select(_LICENSES, prompt="Choose a license", id="license"),
+            Select(_GITIGNORES, prompt="Choose .gitignore template", id="gitignore"),
             Horizontal(
                 Button("Create", variant="primary", id="create"),
                 Button("Cancel", variant="default", id="cancel"),
@@ -84,13 +116,25 @@ class CreateRepoDialog(Screen):
             gitignore=gitignore
         )
 
+        self.run_worker(
+            partial(self._create_repository, self.app.repo_ops, options),
+            thread=True,
+            exclusive=True
+        )
+
+    def _create_repository(self, repo_ops: RepositoryOperations, options: RepoCreateOptions) -> None:
+        """Create the repository in a worker thread"""
         try:
-            repo_ops = RepositoryOperations()
             repo = repo_ops.create_repository(options)
-            self.notify(f"Repository {repo.name} created successfully!", severity="success")
-            self.dismiss(repo)
         except Exception as e:
-            self.notify(f"Failed to create repository: {str(e)}", severity="error")
+            self.app.call_from_thread(
+                self.notify, f"Failed to create repository: {str(e)}", severity="error"
+            )
+            return
+        self.app.call_from_thread(
+            self.notify, f"Repository {repo.name} created successfully!", severity="success"
+        )
+        self.app.call_from_thread(self.dismiss, repo)
 
 class IssueDialog(Screen):
     """Dialog for creating a new issue"""
@@ -120,15 +164,29 @@ class IssueDialog(Screen):
         """Create a new issue"""
         title = self.query_one("#title-input").value
         body = self.query_one("#body-input").value
-        labels = [l.strip() for l in self.query_one("#labels").value.split(",") if l.strip()]
-        assignees = [a.strip() for a in self.query_one("#assignees").value.split(",") if a.strip()]
+        labels = _csv(self.query_one("#labels").value)
+        assignees = _csv(self.query_one("#assignees").value)
 
         if not title:
             self.notify("Issue title is required", severity="error")
             return
 
+        self.run_worker(
+            partial(self._create_issue, self.app.repo_ops, title, body, labels, assignees),
+            thread=True,
+            exclusive=True
+        )
+
+    def _create_issue(
+        self,
+        repo_ops: RepositoryOperations,
+        title: str,
+        body: str,
+        labels: list,
+        assignees: list
+    ) -> None:
+        """Create the issue in a worker thread"""
         try:
-            repo_ops = RepositoryOperations()
             issue = repo_ops.create_issue(
                 self.repo_name,  # Set when dialog is shown
                 title,
@@ -136,10 +194,13 @@ class IssueDialog(Screen):
                 labels,
                 assignees
             )
-            self.notify("Issue created successfully!", severity="success")
-            self.dismiss(issue)
         except Exception as e:
-            self.notify(f"Failed to create issue: {str(e)}", severity="error")
+            self.app.call_from_thread(
+                self.notify, f"Failed to create issue: {str(e)}", severity="error"
+            )
+            return
+        self.app.call_from_thread(self.notify, "Issue created successfully!", severity="success")
+        self.app.call_from_thread(self.dismiss, issue)
 
 class RepoManagementScreen(Screen):
     """Main repository management screen"""
@@ -179,31 +240,69 @@ class RepoManagementScreen(Screen):
 
     def on_mount(self) -> None:
         """Handle screen mount"""
-        self.repo_ops = RepositoryOperations()
+        self.repo_ops = self.app.repo_ops
+        self._service = "github"  # Default until a service is picked
+        self._search_debounce = Debouncer(self, REMOTE_SEARCH_DEBOUNCE)
+        self._repo_list = self.query_one("#repo-list", ListView)
+        self._loading = self.query_one("#loading", LoadingIndicator)
         self.load_repositories()
 
     def load_repositories(self) -> None:
         """Load repositories for selected service"""
+        self._start_search("", "Failed to load repositories")
+
+    def _start_search(self, query: str, error_message: str) -> None:
+        """Search repositories in a worker thread, replacing any search in flight"""
         service = self.get_selected_service()
-        loading = self.query_one("#loading")
-        loading.visible = True
+        cached = _search_cache.get((service, query))
+        if cached is not None and time.monotonic() - cached[0] < SEARCH_CACHE_TTL:
+            self.workers.cancel_group(self, "search")
+            self._loading.visible = False
+            self.show_repositories(cached[1])
+            return
 
+        self._loading.visible = True
+        self.run_worker(
+            partial(self._search_repositories, query, service, error_message),
+            thread=True,
+            exclusive=True,
+            group="search"
+        )
+
+    def _search_repositories(self, query: str, service: str, error_message: str) -> None:
+        """Run a repository search in a worker thread"""
         try:
-            repos = self.repo_ops.search_repositories("", service=service)
-            self.query_one("#repo-list").clear()
-            for repo in repos:
-                self.query_one("#repo-list").append(f"{repo.owner}/{repo.name}")
+            repos = self.repo_ops.search_repositories(query, service=service)
+            _cache_search(service, query, repos)
+            update = partial(self.show_repositories, repos)
         except Exception as e:
-            self.notify(f"Failed to load repositories: {str(e)}", severity="error")
-        finally:
-            loading.visible = False
+            update = partial(self.notify, f"{error_message}: {str(e)}", severity="error")
+
+        # A newer search replaced this one; leave the screen to it
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._finish_search, update)
+
+    def _finish_search(self, update) -> None:
+        """Apply a search result and hide the loading indicator"""
+        update()
+        self._loading.visible = False
+
+    def show_repositories(self, repos) -> None:
+        """Replace the repository list contents in a single mount"""
+        labels = [repo.full_name for repo in repos]
+        repo_list = self._repo_list
+        with self.app.batch_update():
+            repo_list.clear()
+            repo_list.extend([ListItem(Label(label)) for label in labels])
+
+    def on_radio_set_changed(self, event: RadioSet.Changed) -> None:
+        """Remember the service picked in the service selector"""
+        if event.radio_set.id == "service-select":
+            self._service = event.pressed.id or "github"
 
     def get_selected_service(self) -> str:
         """Get currently selected service"""
-        for button in self.query_one("#service-select").query("RadioButton"):
-            if button.value:
-                return button.id
-        return "github"  # Default to GitHub
+        return self._service
 
     def action_new_repo(self) -> None:
         """Show create repository dialog"""
@@ -211,21 +310,35 @@ class RepoManagementScreen(Screen):
 
     def action_fork_repo(self) -> None:
         """Fork selected repository"""
-        selected = self.query_one("#repo-list").selected
+        selected = self._repo_list.selected
         if not selected:
             self.notify("Select a repository to fork", severity="warning")
             return
 
+        self.run_worker(
+            partial(self._fork_repository, selected, self.get_selected_service()),
+            thread=True,
+            group="changes"
+        )
+
+    def _fork_repository(self, selected: str, service: str) -> None:
+        """Fork a repository in a worker thread"""
         try:
             repo = self.repo_ops.fork_repository(selected)
-            self.notify(f"Repository forked successfully: {repo.name}", severity="success")
-            self.load_repositories()
         except Exception as e:
-            self.notify(f"Failed to fork repository: {str(e)}", severity="error")
+            self.app.call_from_thread(
+                self.notify, f"Failed to fork repository: {str(e)}", severity="error"
+            )
+            return
+        _invalidate_search_cache(service)
+        self.app.call_from_thread(
+            self.notify, f"Repository forked successfully: {repo.name}", severity="success"
+        )
+        self.app.call_from_thread(self.load_repositories)
 
     def action_new_issue(self) -> None:
         """Show create issue dialog"""
-        selected = self.query_one("#repo-list").selected
+        selected = self._repo_list.selected
         if not selected:
             self.notify("Select a repository to create an issue", severity="warning")
             return
@@ -236,36 +349,45 @@ class RepoManagementScreen(Screen):
 
     def action_delete_repo(self) -> None:
         """Delete selected repository"""
-        selected = self.query_one("#repo-list").selected
+        selected = self._repo_list.selected
         if not selected:
             self.notify("Select a repository to delete", severity="warning")
             return
 
+        self.run_worker(
+            partial(self._delete_repository, selected, self.get_selected_service()),
+            thread=True,
+            group="changes"
+        )
+
+    def _delete_repository(self, selected: str, service: str) -> None:
+        """Delete a repository in a worker thread"""
         try:
-            if self.repo_ops.delete_repository(selected):
-                self.notify(f"Repository {selected} deleted successfully", severity="success")
-                self.load_repositories()
-            else:
-                self.notify("Failed to delete repository", severity="error")
+            deleted = self.repo_ops.delete_repository(selected)
         except Exception as e:
-            self.notify(f"Failed to delete repository: {str(e)}", severity="error")
+            self.app.call_from_thread(
+                self.notify, f"Failed to delete repository: {str(e)}", severity="error"
+            )
+            return
+        if deleted:
+            _invalidate_search_cache(service)
+            self.app.call_from_thread(
+                self.notify, f"Repository {selected} deleted successfully", severity="success"
+            )
+            self.app.call_from_thread(self.load_repositories)
+        else:
+            self.app.call_from_thread(self.notify, "Failed to delete repository", severity="error")
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Search once typing in the search box pauses"""
+        if event.input.id != "search-input":
+            return
+        self._search_debounce(self.action_search)
 
     def action_search(self) -> None:
         """Search repositories"""
-        query = self.query_one("#search-input").value
-        service = self.get_selected_service()
-        loading = self.query_one("#loading")
-        loading.visible = True
-
-        try:
-            repos = self.repo_ops.search_repositories(query, service=service)
-            self.query_one("#repo-list").clear()
-            for repo in repos:
-                self.query_one("#repo-list").append(f"{repo.owner}/{repo.name}")
-        except Exception as e:
-            self.notify(f"Search failed: {str(e)}", severity="error")
-        finally:
-            loading.visible = False
+        self._search_debounce.cancel()
+        self._start_search(self.query_one("#search-input").value, "Search failed")
 
     def action_back(self) -> None:
         """Return to main screen"""
@@ -18,6 +18,7 @@ from textual.widgets import (
 )
 from textual.binding import Binding
 from pathlib import Path
+from typing import Optional
 from ..core.config import Config
 from ..core.auth import TokenManager
 
@@ -29,10 +30,59 @@ class SettingsScreen(Screen):
         Binding("ctrl+s", "save", "Save Settings"),
     ]
 
+    # Tab id -> method building that tab's settings panel
+    _PANEL_BUILDERS = {
+        "general": "_build_general",
+        "user": "_build_user",
+        "display": "_build_display",
+        "downloads": "_build_downloads",
+        "services": "_build_services",
+        "credentials": "_build_credentials",
+        "updates": "_build_updates",
+    }
+
+    # Theme name -> radio button id
+    _THEME_BUTTONS = {
+        "light": "theme-light",
+        "dark": "theme-dark",
+        "system": "theme-system",
+    }
+    _THEME_NAMES = {button_id: theme for theme, button_id in _THEME_BUTTONS.items()}
+
+    # Service name -> (enabled switch id, prefer SSH switch id)
+    _SERVICE_SWITCHES = {
+        "github": ("github-enabled", "github-ssh"),
+        "gitlab": ("gitlab-enabled", "gitlab-ssh"),
+        "bitbucket": ("bitbucket-enabled", "bitbucket-ssh"),
+    }
+
+    # Credential inputs and the keyring entry each one is stored under
+    _CREDENTIALS = (
+        ("github-token", "github"),
+        ("gitlab-token", "gitlab"),
+        ("bitbucket-user", "bitbucket_user"),
+        ("bitbucket-token", "bitbucket_token"),
+    )
+
     def __init__(self):
         super().__init__()
-        self.config = Config()
-        self.token_manager = TokenManager()
+        # Keyring lookups go over IPC; remember them for the screen's lifetime
+        self._token_cache = {}
+        # Panels are built the first time their tab is opened
+        self._panels = {}
+        self._widgets = {}
+        # Tracked as the radio set changes so saving needn't scan the buttons
+        self._theme = "dark"
+
+    @property
+    def config(self) -> Config:
+        """Application configuration shared with the app"""
+        return self.app.config
+
+    @property
+    def token_manager(self) -> TokenManager:
+        """Token manager shared with the app"""
+        return self.app.token_manager
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the settings screen"""
@@ -47,286 +97,325 @@ class SettingsScreen(Screen):
                 Tab("Credentials", id="credentials"),
                 Tab("Updates", id="updates"),
             ),
-            ScrollableContainer(
-                # General Settings
-                Container(
-                    Vertical(
-                        Label("Default Download Path:"),
-                        Input(
-                            placeholder="Default path for repository downloads",
-                            id="default-download-path"
-                        ),
-                        Label("Temporary Files Path:"),
-                        Input(
-                            placeholder="Path for temporary files",
-                            id="temp-path"
-                        ),
-                        Label("Log Files Path:"),
-                        Input(
-                            placeholder="Path for log files",
-                            id="log-path"
-                        ),
-                    ),
-                    id="general-settings",
+            ScrollableContainer(id="settings-body"),
+            Horizontal(
+                Button("Save", variant="primary", id="save"),
+                Button("Reset to Defaults", variant="default", id="reset"),
+                Button("Back", variant="default", id="back"),
+            ),
+        )
+
+    def _build_general(self) -> Container:
+        """Build the general settings panel"""
+        return Container(
+            Vertical(
+                Label("Default Download Path:"),
+                Input(
+                    placeholder="Default path for repository downloads",
+                    id="default-download-path"
                 ),
-                # User Settings
-                Container(
-                    Vertical(
-                        Label("User Name:"),
-                        Input(
-                            placeholder="Your name",
-                            id="user-name"
-                        ),
-                        Label("Email:"),
-                        Input(
-                            placeholder="Your email",
-                            id="user-email"
-                        ),
-                    ),
-                    id="user-settings",
-                    classes="hidden"
+                Label("Temporary Files Path:"),
+                Input(
+                    placeholder="Path for temporary files",
+                    id="temp-path"
                 ),
-                # Display Settings
-                Container(
-                    Vertical(
-                        Label("Theme:"),
-                        RadioSet(
-                            RadioButton("Light", id="theme-light"),
-                            RadioButton("Dark", id="theme-dark"),
-                            RadioButton("System", id="theme-system"),
-                            id="theme-select"
-                        ),
-                        Switch("Show Progress Bars", id="show-progress"),
-                        Switch("Show Message Center", id="show-messages"),
-                        Label("Message Retention (days):"),
-                        Input(
-                            placeholder="Days to keep messages",
-                            id="message-retention"
-                        ),
-                    ),
-                    id="display-settings",
-                    classes="hidden"
+                Label("Log Files Path:"),
+                Input(
+                    placeholder="Path for log files",
+                    id="log-path"
                 ),
-                # Download Settings
-                Container(
-                    Vertical(
-                        Label("Maximum Concurrent Downloads:"),
-                        Input(
-                            placeholder="Number of concurrent downloads",
-                            id="max-concurrent"
-                        ),
-                        Label("Download Timeout (seconds):"),
-                        Input(
-                            placeholder="Download timeout in seconds",
-                            id="download-timeout"
-                        ),
-                        Switch("Verify SSL Certificates", id="verify-ssl"),
-                        Switch("Allow Multiple Selection", id="allow-multiple"),
-                    ),
-                    id="download-settings",
-                    classes="hidden"
+            ),
+            id="general-settings",
+        )
+
+    def _build_user(self) -> Container:
+        """Build the user settings panel"""
+        return Container(
+            Vertical(
+                Label("User Name:"),
+                Input(
+                    placeholder="Your name",
+                    id="user-name"
                 ),
-                # Services Settings
-                Container(
-                    Vertical(
-                        Label("GitHub Settings:"),
-                        Switch("Enable GitHub", id="github-enabled"),
-                        Switch("Use GitHub CLI", id="github-cli"),
-                        Switch("Prefer SSH for GitHub", id="github-ssh"),
-                        Label("GitLab Settings:"),
-                        Switch("Enable GitLab", id="gitlab-enabled"),
-                        Switch("Prefer SSH for GitLab", id="gitlab-ssh"),
-                        Label("Bitbucket Settings:"),
-                        Switch("Enable Bitbucket", id="bitbucket-enabled"),
-                        Switch("Prefer SSH for Bitbucket", id="bitbucket-ssh"),
-                    ),
-                    id="services-settings",
-                    classes="hidden"
+                Label("Email:"),
+                Input(
+                    placeholder="Your email",
+                    id="user-email"
                 ),
-                # Credentials Settings
-                Container(
-                    Vertical(
-                        Label("GitHub Token:"),
-                        Input(placeholder="GitHub PAT", id="github-token", password=True),
-                        Label("GitLab Token:"),
-                        Input(placeholder="GitLab PAT", id="gitlab-token", password=True),
-                        Label("Bitbucket Username:"),
-                        Input(placeholder="Username", id="bitbucket-user"),
-                        Label("Bitbucket App Password:"),
-                        Input(placeholder="App password", id="bitbucket-token", password=True),
-                    ),
-                    id="credentials-settings",
-                    classes="hidden"
+            ),
+            id="user-settings",
+        )
+
+    def _build_display(self) -> Container:
+        """Build the display settings panel"""
+        return Container(
+            Vertical(
+                Label("Theme:"),
+                RadioSet(
+                    RadioButton("Light", id="theme-light"),
+                    RadioButton("Dark", id="theme-dark"),
+                    RadioButton("System", id="theme-system"),
+                    id="theme-select"
                 ),
-                # Update Settings
-                Container(
-                    Vertical(
-                        Switch("Automatically Check for Updates", id="auto-update"),
-                        Label("Check Interval (days):"),
-                        Input(
-                            placeholder="Days between update checks",
-                            id="update-interval"
-                        ),
-                        Button("Check for Updates Now", variant="primary", id="check-updates"),
-                        Label("Last Check:", id="last-check"),
-                    ),
-                    id="update-settings",
-                    classes="hidden"
+                Switch("Show Progress Bars", id="show-progress"),
+                Switch("Show Message Center", id="show-messages"),
+                Label("Message Retention (days):"),
+                Input(
+                    placeholder="Days to keep messages",
+                    id="message-retention"
                 ),
             ),
-            Horizontal(
-                Button("Save", variant="primary", id="save"),
-                Button("Reset to Defaults", variant="default", id="reset"),
-                Button("Back", variant="default", id="back"),
+            id="display-settings",
+        )
+
+    def _build_downloads(self) -> Container:
+        """Build the download settings panel"""
+        return Container(
+            Vertical(
+                Label("Maximum Concurrent Downloads:"),
+                Input(
+                    placeholder="Number of concurrent downloads",
+                    id="max-concurrent"
+                ),
+                Label("Download Timeout (seconds):"),
+                Input(
+                    placeholder="Download timeout in seconds",
+                    id="download-timeout"
+                ),
+                Switch("Verify SSL Certificates", id="verify-ssl"),
+                Switch("Allow Multiple Selection", id="allow-multiple"),
             ),
+            id="download-settings",
         )
 
-    def on_mount(self) -> None:
-        """Load current settings when the screen is mounted"""
-        self.load_settings()
+    def _build_services(self) -> Container:
+        """Build the service settings panel"""
+        return Container(
+            Vertical(
+                Label("GitHub Settings:"),
+                Switch("Enable GitHub", id="github-enabled"),
+                Switch("Use GitHub CLI", id="github-cli"),
+                Switch("Prefer SSH for GitHub", id="github-ssh"),
+                Label("GitLab Settings:"),
+                Switch("Enable GitLab", id="gitlab-enabled"),
+                Switch("Prefer SSH for GitLab", id="gitlab-ssh"),
+                Label("Bitbucket Settings:"),
+                Switch("Enable Bitbucket", id="bitbucket-enabled"),
+                Switch("Prefer SSH for Bitbucket", id="bitbucket-ssh"),
+            ),
+            id="services-settings",
+        )
+
+    def _build_credentials(self) -> Container:
+        """Build the credentials settings panel"""
+        return Container(
+            Vertical(
+                Label("GitHub Token:"),
+                Input(placeholder="GitHub PAT", id="github-token", password=True),
+                Label("GitLab Token:"),
+                Input(placeholder="GitLab PAT", id="gitlab-token", password=True),
+                Label("Bitbucket Username:"),
+                Input(placeholder="Username", id="bitbucket-user"),
+                Label("Bitbucket App Password:"),
+                Input(placeholder="App password", id="bitbucket-token", password=True),
+            ),
+            id="credentials-settings",
+        )
 
-    def on_tabs_tab_activated(self, event: Tabs.TabActivated) -> None:
+    def _build_updates(self) -> Container:
+        """Build the update settings panel"""
+        return Container(
+            Vertical(
+                Switch("Automatically Check for Updates", id="auto-update"),
+                Label("Check Interval (days):"),
+                Input(
+                    placeholder="Days between update checks",
+                    id="update-interval"
+                ),
+                Button("Check for Updates Now", variant="primary", id="check-updates"),
+                Label("Last Check:", id="last-check"),
+            ),
+            id="update-settings",
+        )
+
+    async def on_tabs_tab_activated(self, event: Tabs.TabActivated) -> None:
         """Handle tab changes"""
-        # Hide all settings containers
-        for container in self.query("Container.hidden, Container:not(.hidden)"):
-            container.add_class("hidden")
+        tab_id = event.tab.id
+        if tab_id is None:
+            return
+        if tab_id not in self._panels:
+            panel = getattr(self, self._PANEL_BUILDERS[tab_id])()
+            await self.query_one("#settings-body").mount(panel)
+            self._panels[tab_id] = panel
+            # Remember the new widgets so loading and saving never query the DOM
+            self._widgets.update(
+                (widget.id, widget) for widget in panel.query("*") if widget.id
+            )
+            self.load_settings((tab_id,))
+
+        # Show only the selected settings panel
+        for panel_id, panel in self._panels.items():
+            panel.display = panel_id == tab_id
+
+    def load_settings(self, tabs=None) -> None:
+        """Load current settings into the UI
 
-        # Show the selected container
-        settings_id = f"{event.tab.id}-settings"
-        container = self.query_one(f"#{settings_id}")
-        container.remove_class("hidden")
+        Args:
+            tabs: Tab ids whose panels to fill. Defaults to every built panel.
+        """
+        if tabs is None:
+            tabs = self._panels
+        # Read sections straight from the loaded config dict
+        cfg = self.config.config
 
-    def load_settings(self) -> None:
-        """Load current settings into the UI"""
         # Load paths
-        paths = self.config.get("paths", {})
-        self.query_one("#default-download-path").value = paths.get("default_download", "")
-        self.query_one("#temp-path").value = paths.get("temp", "")
-        self.query_one("#log-path").value = paths.get("logs", "")
+        if "general" in tabs:
+            paths = cfg.get("paths", {})
+            self._widgets["default-download-path"].value = paths.get("default_download", "")
+            self._widgets["temp-path"].value = paths.get("temp", "")
+            self._widgets["log-path"].value = paths.get("logs", "")
 
         # Load user info
-        user = self.config.get("user", {})
-        self.query_one("#user-name").value = user.get("name", "")
-        self.query_one("#user-email").value = user.get("email", "")
+        if "user" in tabs:
+            user = cfg.get("user", {})
+            self._widgets["user-name"].value = user.get("name", "")
+            self._widgets["user-email"].value = user.get("email", "")
 
         # Load display settings
-        display = self.config.get("display", {})
-        theme = display.get("theme", "dark")
-        self.query_one(f"#theme-{theme}").value = True
-        self.query_one("#show-progress").value = display.get("show_progress", True)
-        self.query_one("#show-messages").value = display.get("show_messages", True)
-        self.query_one("#message-retention").value = str(display.get("message_retention_days", 7))
+        if "display" in tabs:
+            display = cfg.get("display", {})
+            theme = display.get("theme", "dark")
+            self._widgets[self._THEME_BUTTONS[theme]].value = True
+            self._theme = theme
+            self._widgets["show-progress"].value = display.get("show_progress", True)
+            self._widgets["show-messages"].value = display.get("show_messages", True)
+            self._widgets["message-retention"].value = str(display.get("message_retention_days", 7))
 
         # Load download settings
-        download = self.config.get("download", {})
-        self.query_one("#max-concurrent").value = str(download.get("max_concurrent", 3))
-        self.query_one("#download-timeout").value = str(download.get("timeout_seconds", 300))
-        self.query_one("#verify-ssl").value = download.get("verify_ssl", True)
-        self.query_one("#allow-multiple").value = download.get("allow_multiple_selection", True)
+        if "downloads" in tabs:
+            download = cfg.get("download", {})
+            self._widgets["max-concurrent"].value = str(download.get("max_concurrent", 3))
+            self._widgets["download-timeout"].value = str(download.get("timeout_seconds", 300))
+            self._widgets["verify-ssl"].value = download.get("verify_ssl", True)
+            self._widgets["allow-multiple"].value = download.get("allow_multiple_selection", True)
 
         # Load service settings
-        services = self.config.get("services", {})
-        for service in ["github", "gitlab", "bitbucket"]:
-            service_config = services.get(service, {})
-            self.query_one(f"#{service}-enabled").value = service_config.get("enabled", True)
-            if service == "github":
-                self.query_one("#github-cli").value = service_config.get("use_gh_cli", True)
-            self.query_one(f"#{service}-ssh").value = service_config.get("prefer_ssh", True)
+        if "services" in tabs:
+            services = cfg.get("services", {})
+            for service, (enabled_id, ssh_id) in self._SERVICE_SWITCHES.items():
+                service_config = services.get(service, {})
+                self._widgets[enabled_id].value = service_config.get("enabled", True)
+                if service == "github":
+                    self._widgets["github-cli"].value = service_config.get("use_gh_cli", True)
+                self._widgets[ssh_id].value = service_config.get("prefer_ssh", True)
 
         # Load update settings
-        updates = self.config.get("updates", {})
-        self.query_one("#auto-update").value = updates.get("auto_check", True)
-        self.query_one("#update-interval").value = str(updates.get("check_interval_days", 7))
-        last_check = updates.get("last_check", "Never")
-        self.query_one("#last-check").update(f"Last Check: {last_check}")
+        if "updates" in tabs:
+            updates = cfg.get("updates", {})
+            self._widgets["auto-update"].value = updates.get("auto_check", True)
+            self._widgets["update-interval"].value = str(updates.get("check_interval_days", 7))
+            last_check = updates.get("last_check", "Never")
+            self._widgets["last-check"].update(f"Last Check: {last_check}")
 
         # Load stored credentials
-        self.query_one("#github-token").value = self.token_manager.get_token("github") or ""
-        self.query_one("#gitlab-token").value = self.token_manager.get_token("gitlab") or ""
-        self.query_one("#bitbucket-user").value = self.token_manager.get_token("bitbucket_user") or ""
-        self.query_one("#bitbucket-token").value = self.token_manager.get_token("bitbucket_token") or ""
+        if "credentials" in tabs:
+            for widget_id, key in self._CREDENTIALS:
+                self._widgets[widget_id].value = self._get_token(key) or ""
+
+    def _get_token(self, key: str) -> Optional[str]:
+        """Get a stored credential, asking the keyring only once per key"""
+        if key not in self._token_cache:
+            self._token_cache[key] = self.token_manager.get_token(key)
+        return self._token_cache[key]
 
     def save_settings(self) -> None:
-        """Save current settings"""
+        """Save current settings
+
+        Panels that were never opened keep their stored values.
+        """
+        cfg = self.config.config
+        panels = self._panels
+
         # Save paths
-        self.config.config["paths"] = {
-            "default_download": self.query_one("#default-download-path").value,
-            "temp": self.query_one("#temp-path").value,
-            "logs": self.query_one("#log-path").value
-        }
+        if "general" in panels:
+            cfg["paths"] = {
+                "default_download": self._widgets["default-download-path"].value,
+                "temp": self._widgets["temp-path"].value,
+                "logs": self._widgets["log-path"].value
+            }
 
         # Save user info
-        self.config.config["user"] = {
-            "name": self.query_one("#user-name").value,
-            "email": self.query_one("#user-email").value,
-            "home_dir": str(Path.home())
-        }
+        if "user" in panels:
+            cfg["user"] = {
+                "name": self._widgets["user-name"].value,
+                "email": self._widgets["user-email"].value,
+                "home_dir": str(Path.home())
+            }
 
         # Save display settings
-        theme = next(
-            button.id.replace("theme-", "")
-            for button in self.query("RadioButton")
-            if button.value and button.id.startswith("theme-")
-        )
-        self.config.config["display"] = {
-            "theme": theme,
-            "show_progress": self.query_one("#show-progress").value,
-            "show_messages": self.query_one("#show-messages").value,
-            "message_retention_days": int(self.query_one("#message-retention").value or 7)
-        }
+        if "display" in panels:
+            cfg["display"] = {
+                "theme": self._theme,
+                "show_progress": self._widgets["show-progress"].value,
+                "show_messages": self._widgets["show-messages"].value,
+                "message_retention_days": int(self._widgets["message-retention"].value or 7)
+            }
 
         # Save download settings
-        self.config.config["download"] = {
-            "max_concurrent": int(self.query_one("#max-concurrent").value or 3),
-            "timeout_seconds": int(self.query_one("#download-timeout").value or 300),
-            "verify_ssl": self.query_one("#verify-ssl").value,
-            "allow_multiple_selection": self.query_one("#allow-multiple").value
-        }
+        if "downloads" in panels:
+            cfg["download"] = {
+                "max_concurrent": int(self._widgets["max-concurrent"].value or 3),
+                "timeout_seconds": int(self._widgets["download-timeout"].value or 300),
+                "verify_ssl": self._widgets["verify-ssl"].value,
+                "allow_multiple_selection": self._widgets["allow-multiple"].value
+            }
 
         # Save service settings
-        services = {}
-        for service in ["github", "gitlab", "bitbucket"]:
-            services[service] = {
-                "enabled": self.query_one(f"#{service}-enabled").value,
-                "prefer_ssh": self.query_one(f"#{service}-ssh").value
-            }
-            if service == "github":
-                services[service]["use_gh_cli"] = self.query_one("#github-cli").value
-        self.config.config["services"] = services
+        if "services" in panels:
+            services = {}
+            for service, (enabled_id, ssh_id) in self._SERVICE_SWITCHES.items():
+                services[service] = {
+                    "enabled": self._widgets[enabled_id].value,
+                    "prefer_ssh": self._widgets[ssh_id].value
+                }
+                if service == "github":
+                    services[service]["use_gh_cli"] = self._widgets["github-cli"].value
+            cfg["services"] = services
 
         # Save update settings
-        self.config.config["updates"] = {
-            "auto_check": self.query_one("#auto-update").value,
-            "check_interval_days": int(self.query_one("#update-interval").value or 7),
-            "last_check": self.config.get("updates", {}).get("last_check")
-        }
-
-        # Save credentials
-        gt = self.query_one("#github-token").value
-        if gt:
-            self.token_manager.store_token("github", gt)
-        else:
-            self.token_manager.remove_token("github")
-        glt = self.query_one("#gitlab-token").value
-        if glt:
-            self.token_manager.store_token("gitlab", glt)
-        else:
-            self.token_manager.remove_token("gitlab")
-        bu = self.query_one("#bitbucket-user").value
-        if bu:
-            self.token_manager.store_token("bitbucket_user", bu)
-        else:
-            self.token_manager.remove_token("bitbucket_user")
-        btok = self.query_one("#bitbucket-token").value
-        if btok:
-            self.token_manager.store_token("bitbucket_token", btok)
-        else:
-            self.token_manager.remove_token("bitbucket_token")
+        if "updates" in panels:
+            cfg["updates"] = {
+                "auto_check": self._widgets["auto-update"].value,
+                "check_interval_days": int(self._widgets["update-interval"].value or 7),
+                "last_check": cfg.get("updates", {}).get("last_check")
+            }
+
+        # Save credentials, skipping keyring writes for unchanged values
+        if "credentials" in panels:
+            changed = False
+            for widget_id, key in self._CREDENTIALS:
+                value = self._widgets[widget_id].value or None
+                if value == self._get_token(key):
+                    continue
+                if value:
+                    self.token_manager.store_token(key, value)
+                else:
+                    self.token_manager.remove_token(key)
+                self._token_cache[key] = value
+                changed = True
+            if changed:
+                # Service clients are built from the stored tokens
+                self.app.reset_repo_ops()
 
         # Save all changes
         self.config._save_config()
         self.notify("Settings saved successfully!", severity="success")
 
+    def on_radio_set_changed(self, event: RadioSet.Changed) -> None:
+        """Track the selected theme"""
+        if event.radio_set.id == "theme-select" and event.pressed.id is not None:
+            self._theme = self._THEME_NAMES.get(event.pressed.id, self._theme)
+
     def action_save(self) -> None:
         """Save settings and notify user"""
         self.save_settings()
@@ -3,15 +3,20 @@ Text viewing screen for displaying content
 """
 from textual.app import ComposeResult
 from textual.screen import Screen
-from textual.containers import Container, ScrollableContainer
+from textual.containers import Container
 from textual.widgets import (
     Button,
     Label,
-    Static,
+    Log,
     Footer
 )
 from textual.binding import Binding
 
+try:
+    import pyperclip
+except ImportError:
+    pyperclip = None
+
 class TextScreen(Screen):
     """Screen for viewing text content"""
     
@@ -30,31 +35,34 @@ class TextScreen(Screen):
         super().__init__()
         self.title = title
         self.content = content
+        self._lines = content.splitlines()
         
     def compose(self) -> ComposeResult:
         """Create child widgets"""
         yield Container(
             Label(self.title, id="title"),
-            ScrollableContainer(
-                Static(self.content, id="content"),
-                id="content-scroll"
-            ),
+            # Log only renders the lines in view, so large content stays cheap
+            Log(id="content", auto_scroll=False),
             Button("Back", variant="primary", id="back"),
             Footer()
         )
         
+    def on_mount(self) -> None:
+        """Fill the viewer with the content"""
+        self.query_one("#content", Log).write_lines(self._lines)
+        
     def action_back(self) -> None:
         """Return to previous screen"""
         self.dismiss()
         
     def action_copy(self) -> None:
         """Copy content to clipboard"""
-        try:
-            import pyperclip
-            pyperclip.copy(self.content)
-            self.notify("Content copied to clipboard", severity="success")
-        except ImportError:
+        if pyperclip is None:
             self.notify("pyperclip not installed - cannot copy to clipboard", severity="error")
+            return
+            
+        pyperclip.copy(self.content)
+        self.notify("Content copied to clipboard", severity="success")
             
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses"""
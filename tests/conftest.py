@@ -1,59 +1,115 @@
 """
 Test configuration and fixtures
 """
+import copy
 import pytest
-from pathlib import Path
-import tempfile
 import shutil
-import sys
-import os
+import yaml
+from typing import Dict, Tuple
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+# In-memory keyring: (service, username) -> password
+_KEYRING_STORE: Dict[Tuple[str, str], str] = {}
 
-from repo_tool.core.config import Config
-from repo_tool.core.auth import TokenManager
+def _set_password(service, username, password):
+    _KEYRING_STORE[(service, username)] = password
+
+def _get_password(service, username):
+    return _KEYRING_STORE.get((service, username))
+
+def _delete_password(service, username):
+    _KEYRING_STORE.pop((service, username), None)
 
 @pytest.fixture
-def temp_dir():
+def temp_dir(tmp_path):
     """Create a temporary directory for tests"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    return tmp_path
+
+@pytest.fixture(scope="session")
+def _default_config_template(tmp_path_factory):
+    """Write the default configuration once for tests to copy"""
+    from repo_tool.core.config import DEFAULT_CONFIG
+
+    template = tmp_path_factory.mktemp("template") / "config.yaml"
+    with open(template, "w") as f:
+        yaml.dump(DEFAULT_CONFIG, f)
+    return template
+
+@pytest.fixture(scope="session")
+def config(tmp_path_factory, _default_config_template):
+    """Create a test configuration shared by the session
+
+    Settings changed by a test are reset to the defaults afterwards.
+    """
+    from repo_tool.core.config import Config
 
-@pytest.fixture
-def config(temp_dir):
-    """Create a test configuration"""
     config = Config()
-    config.config_dir = temp_dir / ".config" / "repo_tool"
+    config.config_dir = tmp_path_factory.mktemp("config") / ".config" / "repo_tool"
     config.config_file = config.config_dir / "config.yaml"
-    config._create_default_config()
+    config.config_dir.mkdir(parents=True)
+    shutil.copyfile(_default_config_template, config.config_file)
     return config
 
-@pytest.fixture
-def token_manager(temp_dir):
-    """Create a test token manager"""
-    tm = TokenManager()
-    tm.KEYRING_NAMESPACE = "repo_tool_test"
-    storage = {}
+@pytest.fixture(autouse=True)
+def _reset_config(request):
+    """Restore the shared configuration after tests that use it
 
-    def set_password(service, username, password):
-        storage[(service, username)] = password
+    Copies the default file rather than calling Config.reset(), which would
+    serialize the defaults to YAML again for every test.
+    """
+    yield
+    if "config" in request.fixturenames:
+        from repo_tool.core.config import DEFAULT_CONFIG
 
-    def get_password(service, username):
-        return storage.get((service, username))
+        config = request.getfixturevalue("config")
+        config.config = copy.deepcopy(DEFAULT_CONFIG)
+        shutil.copyfile(request.getfixturevalue("_default_config_template"), config.config_file)
 
-    def delete_password(service, username):
-        storage.pop((service, username), None)
+@pytest.fixture(autouse=True, scope="session")
+def _inmem_keyring():
+    """Replace the system keyring with the in-memory store for the session"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("keyring.set_password", _set_password)
+        mp.setattr("keyring.get_password", _get_password)
+        mp.setattr("keyring.delete_password", _delete_password)
+        yield _KEYRING_STORE
 
-    tm._keyring = {
-        "set_password": set_password,
-        "get_password": get_password,
-        "delete_password": delete_password,
-    }
+@pytest.fixture(autouse=True)
+def _clear_keyring():
+    """Start every test with an empty keyring"""
+    _KEYRING_STORE.clear()
 
-    import keyring
-    keyring.set_password = set_password
-    keyring.get_password = get_password
-    keyring.delete_password = delete_password
+@pytest.fixture(autouse=True, scope="session")
+def _no_real_clone():
+    """Record git clones instead of fetching anything"""
+    clones = []
 
-    return tm
+    def clone_from(url, to_path, **kwargs):
+        clones.append((url, to_path))
 
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("git.Repo.clone_from", clone_from)
+        yield clones
+
+@pytest.fixture
+def clones(_no_real_clone):
+    """(url, path) of every git clone made by the current test"""
+    _no_real_clone.clear()
+    return _no_real_clone
+
+@pytest.fixture
+def search_cache():
+    """The repository search cache, emptied before and after the test"""
+    from repo_tool.tui.repo_screen import _search_cache
+
+    _search_cache.clear()
+    yield _search_cache
+    _search_cache.clear()
+
+@pytest.fixture(scope="session")
+def token_manager():
+    """Create a test token manager shared by the session"""
+    from repo_tool.core.auth import TokenManager
+
+    tm = TokenManager()
+    tm.KEYRING_NAMESPACE = "repo_tool_test"
+    return tm
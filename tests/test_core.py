@@ -2,10 +2,22 @@
 Tests for core functionality
 """
 import pytest
+import sqlite3
+import threading
+import time
 from pathlib import Path
 from repo_tool.core.config import Config
 from repo_tool.core.auth import TokenManager
 from repo_tool.core.repo import Repository, RepoManager
+from repo_tool.core.repo_cache import RepoCache
+from repo_tool.core.messages import MessageCenter, MessageType
+from repo_tool.tui.app import DownloadPool
+from repo_tool.tui.repo_screen import (
+    SEARCH_CACHE_SIZE,
+    SEARCH_CACHE_TTL,
+    _cache_search,
+    _invalidate_search_cache,
+)
 
 def test_config_creation(config):
     """Test configuration creation"""
@@ -41,7 +53,7 @@ def test_repository_validation(temp_dir):
     invalid_path = temp_dir / "nonexistent" / "path"
     assert repo_manager.validate_destination(invalid_path)
 
-def test_repository_download(temp_dir, monkeypatch):
+def test_repository_download(temp_dir, clones):
     """Test repository download functionality"""
     repo = Repository(
         name="test-repo",
@@ -49,16 +61,9 @@ def test_repository_download(temp_dir, monkeypatch):
         url="https://github.com/test/test-repo.git"
     )
     
-    # Mock git.Repo.clone_from to avoid actual cloning
-    def mock_clone_from(*args, **kwargs):
-        (temp_dir / repo.name).mkdir()
-    
-    monkeypatch.setattr("git.Repo.clone_from", mock_clone_from)
-    
     repo_manager = RepoManager()
-    repo_manager.download_repository(repo, temp_dir)
-    
-    assert (temp_dir / repo.name).exists()
+    assert repo_manager.download_repository(repo, temp_dir) == temp_dir / repo.name
+    assert clones == [(repo.url, str(temp_dir / repo.name))]
 
 def test_download_to_existing_directory(temp_dir):
     """Test downloading to an existing directory"""
@@ -76,7 +81,7 @@ def test_download_to_existing_directory(temp_dir):
         repo_manager.download_repository(repo, temp_dir)
 
 
-def test_download_multiple_repositories(temp_dir, monkeypatch):
+def test_download_multiple_repositories(temp_dir, clones):
     repo1 = Repository(
         name="repo1",
         service="github",
@@ -88,14 +93,168 @@ def test_download_multiple_repositories(temp_dir, monkeypatch):
         url="https://github.com/test/repo2.git",
     )
 
-    def mock_clone_from(url, path, progress=None):
-        Path(path).mkdir()
+    repo_manager = RepoManager()
+    assert repo_manager.download_repositories([repo1, repo2], temp_dir) == [
+        temp_dir / repo1.name,
+        temp_dir / repo2.name,
+    ]
+    assert clones == [
+        (repo1.url, str(temp_dir / repo1.name)),
+        (repo2.url, str(temp_dir / repo2.name)),
+    ]
 
-    monkeypatch.setattr("git.Repo.clone_from", mock_clone_from)
 
-    repo_manager = RepoManager()
-    repo_manager.download_repositories([repo1, repo2], temp_dir)
 
-    assert (temp_dir / repo1.name).exists()
-    assert (temp_dir / repo2.name).exists()
+def test_repo_cache_updates_only_newer(temp_dir):
+    """Test repository cache keeps rows until a newer push is reported"""
+    cache = RepoCache(temp_dir / "repos.sqlite")
+    repo = Repository(
+        name="repo1",
+        service="github",
+        url="https://github.com/test/repo1.git",
+        pushed_at="2024-01-01T00:00:00",
+    )
+
+    assert cache.update([repo]) == 1
+    assert cache.load() == [repo]
+
+    # Same push time: nothing to rewrite
+    assert cache.update([repo]) == 0
+
+    newer = Repository(
+        name="repo1",
+        service="github",
+        url="https://github.com/test/repo1.git",
+        description="updated",
+        pushed_at="2024-02-01T00:00:00",
+    )
+    assert cache.update([newer]) == 1
+    assert cache.load() == [newer]
+
+    # A service that failed or was not fetched keeps its rows
+    assert cache.update([]) == 0
+    assert cache.update([], services=["gitlab"]) == 0
+    assert cache.load() == [newer]
+
+    # Repositories no longer listed by a fetched service are dropped
+    assert cache.update([], services=["github"]) == 1
+    assert cache.load() == []
+
+def test_repo_cache_survives_deletion_and_bad_rows(temp_dir):
+    """Test repository cache recovers from a deleted file and skips unreadable rows"""
+    cache = RepoCache(temp_dir / "repos.sqlite")
+    repo = Repository(name="repo1", service="github", url="https://github.com/test/repo1.git")
+
+    # Emptied cache directory, as after the diagnostics cleanup
+    cache.db_path.unlink()
+    assert cache.load() == []
+    assert cache.update([repo]) == 1
+
+    with sqlite3.connect(cache.db_path) as conn:
+        conn.execute(
+            "INSERT INTO repos (service, name, payload) VALUES (?, ?, ?)",
+            ("github", "old", '{"name": "old", "owner": "someone"}'),
+        )
+        conn.execute(
+            "INSERT INTO repos (service, name, payload) VALUES (?, ?, ?)",
+            ("github", "broken", "not json"),
+        )
+    assert cache.load() == [repo]
+
+def test_message_center_aggregate(temp_dir):
+    """Test message counts are grouped by the database"""
+    center = MessageCenter(temp_dir / "messages.db")
+    center.add_message("cloned", source="download")
+    center.add_message("failed", type=MessageType.ERROR, source="download")
+    center.add_message("saved", source="settings")
+
+    assert center.aggregate("type") == {"info": 2, "error": 1}
+    assert list(center.aggregate("source")) == ["download", "settings"]
+    assert sum(center.aggregate("hour").values()) == 3
+
+    with pytest.raises(ValueError):
+        center.aggregate("text")
+
+def test_download_pool_limits_concurrency():
+    """Test the download pool runs at most max_workers jobs at once"""
+    pool = DownloadPool(2)
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def job(i):
+        with lock:
+            running.append(i)
+            peak.append(len(running))
+        time.sleep(0.02)
+        with lock:
+            running.remove(i)
+        return i
+
+    futures = [pool.submit(job, i) for i in range(6)]
+    assert [future.result(timeout=5) for future in futures] == list(range(6))
+    assert max(peak) == 2
+
+def test_download_pool_shutdown_cancels_pending():
+    """Test shutdown cancels queued jobs but lets the running one finish"""
+    pool = DownloadPool(1)
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocker():
+        started.set()
+        release.wait(5)
+        return "done"
+
+    running = pool.submit(blocker)
+    assert started.wait(5)
+    queued = [pool.submit(lambda: "ran") for _ in range(2)]
+
+    pool.shutdown()
+    assert all(future.cancelled() for future in queued)
+    with pytest.raises(RuntimeError):
+        pool.submit(lambda: None)
+
+    release.set()
+    assert running.result(timeout=5) == "done"
+
+def test_download_pool_reports_exceptions():
+    """Test an exception in a job is set on its future"""
+    pool = DownloadPool(1)
+
+    def fail():
+        raise ValueError("clone failed")
+
+    error = pool.submit(fail).exception(timeout=5)
+    assert isinstance(error, ValueError)
+    assert str(error) == "clone failed"
+
+def test_search_cache_drops_expired(search_cache):
+    """Test expired search results are pruned when new ones are cached"""
+    search_cache["github", "old"] = (time.monotonic() - SEARCH_CACHE_TTL - 1, [])
+    search_cache["github", "fresh"] = (time.monotonic(), [])
+
+    _cache_search("github", "new", [])
+    assert set(search_cache) == {("github", "fresh"), ("github", "new")}
+
+def test_search_cache_evicts_oldest(search_cache):
+    """Test the oldest search results are dropped once the cache is full"""
+    for i in range(SEARCH_CACHE_SIZE):
+        _cache_search("github", f"query{i}", [])
+    # Caching a query again moves it to the back of the queue
+    _cache_search("github", "query0", [])
+
+    _cache_search("github", "overflow", [])
+    assert len(search_cache) == SEARCH_CACHE_SIZE
+    assert ("github", "query1") not in search_cache
+    assert ("github", "query0") in search_cache
+    assert ("github", "overflow") in search_cache
+
+def test_search_cache_invalidate_service(search_cache):
+    """Test invalidating a service keeps other services' results"""
+    _cache_search("github", "tool", [])
+    _cache_search("github", "cli", [])
+    _cache_search("gitlab", "tool", [])
 
+    _invalidate_search_cache("github")
+    assert set(search_cache) == {("gitlab", "tool")}
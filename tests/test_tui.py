@@ -1,59 +1,51 @@
 import asyncio
-from repo_tool.tui.app import RepoToolApp
-
-
-def test_settings_screen_opens():
-    async def run_app():
-        import keyring
-        storage = {}
-        keyring.set_password = lambda s, u, p: storage.__setitem__((s, u), p)
-        keyring.get_password = lambda s, u: storage.get((s, u))
-        keyring.delete_password = lambda s, u: storage.pop((s, u), None)
-
+import pytest
+import pytest_asyncio
+from repo_tool.tui.app import (
+    AboutScreen,
+    MessageCenterScreen,
+    RepoToolApp,
+    SettingsScreen,
+)
+
+# Run every test, and the shared app, on the session's event loop. These
+# boot a full Textual app, so they only run with -m slow.
+pytestmark = [pytest.mark.asyncio(loop_scope="session"), pytest.mark.slow]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def pilot(tmp_path_factory):
+    """Run one RepoToolApp for every test in the module
+
+    HOME points at a temporary directory so the app's config, caches and
+    message database are not written to the real home directory.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("HOME", str(tmp_path_factory.mktemp("home")))
         app = RepoToolApp()
         app.token_manager.has_valid_tokens = lambda: True
         async with app.run_test() as pilot:
-            app.action_settings()
-            await pilot.pause(0.1)
-            assert app.screen_stack[-1].__class__.__name__ == 'SettingsScreen'
-
-    asyncio.run(run_app())
-
-
-def test_about_screen_opens():
-    async def run_app():
-        import keyring
-        storage = {}
-        keyring.set_password = lambda s, u, p: storage.__setitem__((s, u), p)
-        keyring.get_password = lambda s, u: storage.get((s, u))
-        keyring.delete_password = lambda s, u: storage.pop((s, u), None)
-
-        app = RepoToolApp()
-        app.token_manager.has_valid_tokens = lambda: True
-        async with app.run_test() as pilot:
-            app.action_about()
-            await pilot.pause(0.1)
-            assert app.screen_stack[-1].__class__.__name__ == 'AboutScreen'
-
-    asyncio.run(run_app())
-
-
-def test_message_center_opens():
-    async def run_app():
-        import keyring
-        storage = {}
-        keyring.set_password = lambda s, u, p: storage.__setitem__((s, u), p)
-        keyring.get_password = lambda s, u: storage.get((s, u))
-        keyring.delete_password = lambda s, u: storage.pop((s, u), None)
-
-        app = RepoToolApp()
-        app.token_manager.has_valid_tokens = lambda: True
-        async with app.run_test() as pilot:
-            app.action_messages()
-            await pilot.pause(0.1)
-            assert app.screen_stack[-1].__class__.__name__ == 'MessageCenterScreen'
-
-    asyncio.run(run_app())
-
-
-
+            yield pilot
+
+
+async def wait_for_screen(app, screen_cls, timeout=1.0):
+    """Wait until a screen_cls screen is on top of the stack"""
+    async def shown():
+        while not isinstance(app.screen_stack[-1], screen_cls):
+            await asyncio.sleep(0)
+
+    await asyncio.wait_for(shown(), timeout)
+
+
+@pytest.mark.parametrize("action,screen_cls", [
+    ("action_settings", SettingsScreen),
+    ("action_about", AboutScreen),
+    ("action_messages", MessageCenterScreen),
+], ids=["settings", "about", "messages"])
+async def test_action_opens_screen(pilot, action, screen_cls):
+    app = pilot.app
+    getattr(app, action)()
+    await wait_for_screen(app, screen_cls)
+    assert isinstance(app.screen_stack[-1], screen_cls)
+    app.pop_screen()
+    await pilot.pause()